@@ -1,8 +1,11 @@
 """Admin API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 from typing import List, Optional
 from pydantic import BaseModel
 
@@ -10,10 +13,25 @@ from app.db.database import get_db, get_user_db
 from app.db.models import Project, TrainingJob, User
 from app.schemas.project import ProjectResponse, ProjectUpdate
 from app.schemas.user import UserResponse
+from app.services.response_cache import (
+    ADMIN_PROJECTS_KEY_PREFIX,
+    ADMIN_USERS_KEY_PREFIX,
+    invalidate_admin_lists,
+    invalidate_project_lists,
+    response_cache,
+)
 from app.utils.dependencies import get_current_active_user
 
 router = APIRouter(tags=["admin"])
 
+# Admin dashboard lists change on a minutes scale; cache them briefly
+ADMIN_LIST_CACHE_TTL = 60
+
+# Keyset pagination for admin lists (rows ordered by id, newest first)
+ADMIN_LIST_DEFAULT_LIMIT = 100
+ADMIN_LIST_MAX_LIMIT = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 class UserRoleUpdate(BaseModel):
     """Schema for updating user role."""
@@ -58,8 +76,22 @@ def require_admin_or_manager(current_user: User = Depends(get_current_active_use
     return current_user
 
 
+def _page_response(page: dict) -> ORJSONResponse:
+    """Render a cached list page directly.
+
+    Items are already JSON-ready (jsonable_encoder ran when the page was
+    loaded), so they skip FastAPI's response serialization on every hit.
+    """
+    headers = {}
+    if page["next_cursor"] is not None:
+        headers[NEXT_CURSOR_HEADER] = str(page["next_cursor"])
+    return ORJSONResponse(page["items"], headers=headers)
+
+
 @router.get("/projects")
-def list_all_projects(
+async def list_all_projects(
+    limit: int = Query(ADMIN_LIST_DEFAULT_LIMIT, ge=1, le=ADMIN_LIST_MAX_LIMIT),
+    cursor: Optional[int] = Query(None, description="Value of the previous page's X-Next-Cursor header"),
     db: Session = Depends(get_db),
     user_db: Session = Depends(get_user_db),
     current_user: User = Depends(require_admin)
@@ -67,50 +99,82 @@ def list_all_projects(
     """List all projects in the system (admin only).
 
     Phase 11: Uses 2-DB pattern - Platform DB for projects, User DB for owners.
+    Keyset-paginated by project id (newest first); the X-Next-Cursor response
+    header carries the cursor for the next page and is absent on the last page.
+    Each page is cached for ADMIN_LIST_CACHE_TTL seconds.
     """
-
-    # Query all projects with experiment counts from Platform DB
-    projects_with_counts = (
-        db.query(
-            Project,
-            func.count(TrainingJob.id).label("experiment_count")
+    page = await response_cache.get_or_set(
+        f"{ADMIN_PROJECTS_KEY_PREFIX}:{cursor}:{limit}",
+        ADMIN_LIST_CACHE_TTL,
+        lambda: run_in_threadpool(_load_projects_page, db, user_db, cursor, limit),
+    )
+    return _page_response(page)
+
+
+def _load_projects_page(db: Session, user_db: Session, cursor: Optional[int], limit: int) -> dict:
+    """Build one page of the admin project list (blocking DB queries)."""
+    # Query project columns with experiment counts from Platform DB.
+    # Column-only select: rows are plain tuples, no Project instances are hydrated.
+    stmt = (
+        select(
+            Project.id,
+            Project.name,
+            Project.description,
+            Project.task_type,
+            Project.created_at,
+            Project.updated_at,
+            Project.user_id,
+            func.count(TrainingJob.id).label("experiment_count"),
         )
         .outerjoin(TrainingJob, TrainingJob.project_id == Project.id)
         .group_by(Project.id)
-        .all()
+        .order_by(Project.id.desc())
+        .limit(limit + 1)  # One extra row tells us whether another page exists
     )
+    if cursor is not None:
+        stmt = stmt.where(Project.id < cursor)
+    project_rows = db.execute(stmt).all()
+
+    next_cursor = None
+    if len(project_rows) > limit:
+        project_rows = project_rows[:limit]
+        next_cursor = project_rows[-1].id
 
     # Get all unique user IDs
-    user_ids = list(set([p.user_id for p, _ in projects_with_counts if p.user_id]))
+    user_ids = {row.user_id for row in project_rows if row.user_id}
 
-    # Fetch users from User DB
-    users = {}
+    # Fetch owner columns from User DB
+    owners = {}
     if user_ids:
-        users_list = user_db.query(User).filter(User.id.in_(user_ids)).all()
-        users = {u.id: u for u in users_list}
+        owner_rows = user_db.execute(
+            select(User.id, User.full_name, User.email).where(User.id.in_(user_ids))
+        ).all()
+        owners = {row.id: row for row in owner_rows}
 
     # Format response
     result = []
-    for project, exp_count in projects_with_counts:
-        owner = users.get(project.user_id)
+    for row in project_rows:
+        owner = owners.get(row.user_id)
         result.append({
-            "id": project.id,
-            "name": project.name,
-            "description": project.description,
-            "task_type": project.task_type,
-            "created_at": project.created_at,
-            "updated_at": project.updated_at,
-            "experiment_count": exp_count,
-            "owner_id": project.user_id,
+            "id": row.id,
+            "name": row.name,
+            "description": row.description,
+            "task_type": row.task_type,
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+            "experiment_count": row.experiment_count,
+            "owner_id": row.user_id,
             "owner_name": owner.full_name if owner else None,
             "owner_email": owner.email if owner else None,
         })
 
-    return result
+    return {"items": jsonable_encoder(result), "next_cursor": next_cursor}
 
 
 @router.get("/users")
-def list_all_users(
+async def list_all_users(
+    limit: int = Query(ADMIN_LIST_DEFAULT_LIMIT, ge=1, le=ADMIN_LIST_MAX_LIMIT),
+    cursor: Optional[int] = Query(None, description="Value of the previous page's X-Next-Cursor header"),
     db: Session = Depends(get_db),
     user_db: Session = Depends(get_user_db),
     current_user: User = Depends(require_admin_or_manager)
@@ -118,27 +182,56 @@ def list_all_users(
     """List all users in the system (admin or manager).
 
     Phase 11: Uses 2-DB pattern - User DB for users, Platform DB for project counts.
+    Keyset-paginated by user id (newest first) like list_all_projects.
+    Each page is cached per requesting role for ADMIN_LIST_CACHE_TTL seconds.
     """
-
-    # Query all users from User DB
+    system_role = current_user.system_role
+    page = await response_cache.get_or_set(
+        f"{ADMIN_USERS_KEY_PREFIX}:{system_role}:{cursor}:{limit}",
+        ADMIN_LIST_CACHE_TTL,
+        lambda: run_in_threadpool(_load_users_page, db, user_db, system_role, cursor, limit),
+    )
+    return _page_response(page)
+
+
+def _load_users_page(
+    db: Session,
+    user_db: Session,
+    system_role: str,
+    cursor: Optional[int],
+    limit: int
+) -> dict:
+    """Build one page of the user list visible to system_role (blocking DB queries)."""
+    # Query users from User DB
     query = user_db.query(User)
 
     # If user is manager, exclude other managers and admins
-    if current_user.system_role == "manager":
+    if system_role == "manager":
         query = query.filter(User.system_role.notin_(["manager", "admin"]))
 
-    users = query.all()
-
-    # Get project counts from Platform DB
-    project_counts_query = (
-        db.query(
-            Project.user_id,
-            func.count(Project.id).label("count")
+    if cursor is not None:
+        query = query.filter(User.id < cursor)
+
+    users = query.order_by(User.id.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(users) > limit:
+        users = users[:limit]
+        next_cursor = users[-1].id
+
+    # Get project counts for this page's users from Platform DB
+    project_counts = {}
+    if users:
+        project_counts_query = (
+            db.query(
+                Project.user_id,
+                func.count(Project.id).label("count")
+            )
+            .filter(Project.user_id.in_([user.id for user in users]))
+            .group_by(Project.user_id)
+            .all()
         )
-        .group_by(Project.user_id)
-        .all()
-    )
-    project_counts = {user_id: count for user_id, count in project_counts_query}
+        project_counts = {user_id: count for user_id, count in project_counts_query}
 
     # Format response
     result = []
@@ -159,13 +252,14 @@ def list_all_users(
             "project_count": project_counts.get(user.id, 0),
         })
 
-    return result
+    return {"items": jsonable_encoder(result), "next_cursor": next_cursor}
 
 
 @router.put("/users/{user_id}")
 def update_user(
     user_id: int,
     user_update: AdminUserUpdate,
+    background_tasks: BackgroundTasks,
     user_db: Session = Depends(get_user_db),
     current_user: User = Depends(require_admin_or_manager)
 ):
@@ -201,6 +295,7 @@ def update_user(
         user.phone_number = user_update.phone_number
 
     user_db.commit()
+    background_tasks.add_task(invalidate_admin_lists)
     user_db.refresh(user)
 
     return {
@@ -215,6 +310,7 @@ def update_user(
 def update_user_role(
     user_id: int,
     role_update: UserRoleUpdate,
+    background_tasks: BackgroundTasks,
     user_db: Session = Depends(get_user_db),
     current_user: User = Depends(require_admin_or_manager)
 ):
@@ -244,6 +340,7 @@ def update_user_role(
     # Update role
     user.system_role = role_update.system_role
     user_db.commit()
+    background_tasks.add_task(invalidate_admin_lists)
     user_db.refresh(user)
 
     return {"message": "Role updated successfully", "user_id": user.id, "new_role": user.system_role}
@@ -252,6 +349,7 @@ def update_user_role(
 @router.delete("/users/{user_id}")
 def delete_user(
     user_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user_db: Session = Depends(get_user_db),
     current_user: User = Depends(require_admin)
@@ -281,6 +379,7 @@ def delete_user(
     # Delete user from User DB
     user_db.delete(user)
     user_db.commit()
+    background_tasks.add_task(invalidate_admin_lists)
 
     return {"message": "User deleted successfully", "user_id": user_id}
 
@@ -289,6 +388,7 @@ def delete_user(
 def update_project(
     project_id: int,
     project_update: AdminProjectUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user_db: Session = Depends(get_user_db),
     current_user: User = Depends(require_admin)
@@ -318,6 +418,8 @@ def update_project(
         project.user_id = project_update.user_id
 
     db.commit()
+    background_tasks.add_task(invalidate_admin_lists)
+    background_tasks.add_task(invalidate_project_lists)
     db.refresh(project)
 
     return {
@@ -333,6 +435,7 @@ def update_project(
 @router.delete("/projects/{project_id}")
 def delete_project(
     project_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
@@ -349,6 +452,8 @@ def delete_project(
     # Delete project (cascade will delete experiments)
     db.delete(project)
     db.commit()
+    background_tasks.add_task(invalidate_admin_lists)
+    background_tasks.add_task(invalidate_project_lists)
 
     return {
         "message": f"Project '{project.name}' deleted successfully",
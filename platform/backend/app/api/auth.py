@@ -2,7 +2,7 @@
 
 import random
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
@@ -16,6 +16,7 @@ from app.core.security import (
 from app.db.database import get_user_db
 from app.db import models
 from app.schemas import user as user_schemas
+from app.services.response_cache import invalidate_admin_lists
 from app.utils.dependencies import get_current_user
 
 router = APIRouter()
@@ -104,6 +105,7 @@ def find_or_create_organization(
 @router.post("/register", response_model=user_schemas.UserResponse, status_code=status.HTTP_201_CREATED)
 def register(
     user_in: user_schemas.UserCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_user_db)
 ):
     """
@@ -159,6 +161,7 @@ def register(
     db.add(db_user)
     db.commit()
     db.refresh(db_user)
+    background_tasks.add_task(invalidate_admin_lists)
 
     return db_user
 
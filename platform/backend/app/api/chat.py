@@ -16,8 +16,6 @@ from app.services.conversation_manager import ConversationManager
 from app.utils.dependencies import get_current_user
 from app.core.config import settings
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -278,16 +276,21 @@ async def get_session(session_id: int, db: DBSession = Depends(get_db)):
 @router.get("/sessions/{session_id}/messages", response_model=list[chat.MessageResponse])
 async def get_messages(session_id: int, db: DBSession = Depends(get_db)):
     """Get all messages in a session."""
-    session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-
     messages = (
         db.query(MessageModel)
         .filter(MessageModel.session_id == session_id)
         .order_by(MessageModel.created_at)
         .all()
     )
+
+    # Only an empty result needs the session existence check (saves a round-trip otherwise)
+    if not messages:
+        session_exists = db.query(
+            db.query(SessionModel.id).filter(SessionModel.id == session_id).exists()
+        ).scalar()
+        if not session_exists:
+            raise HTTPException(status_code=404, detail="Session not found")
+
     return messages
 
 
@@ -370,11 +373,14 @@ async def send_message(
 
         # Create or get session
         if request.session_id:
-            session = db.query(SessionModel).filter(SessionModel.id == request.session_id).first()
+            # Loaded into the identity map here; process_message's Session.get reuses it
+            session = db.get(SessionModel, request.session_id)
             if not session:
                 raise HTTPException(status_code=404, detail="Session not found")
             session_id = session.id
         else:
+            # Committed up front: an error reply rolls back the turn but still
+            # returns this session id, so the row must already exist
             session = await manager.create_new_session()
             session_id = session.id
 
@@ -387,11 +393,11 @@ async def send_message(
             user_id=user_id  # Pass authenticated user ID
         )
 
-        # Get the latest messages
+        # Get the latest messages (served by the (session_id, id) index)
         messages = (
             db.query(MessageModel)
             .filter(MessageModel.session_id == session_id)
-            .order_by(MessageModel.created_at.desc())
+            .order_by(MessageModel.id.desc())
             .limit(2)
             .all()
         )
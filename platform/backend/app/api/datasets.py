@@ -24,6 +24,7 @@ from sqlalchemy.orm import Session
 
 from app.clients.labeler_client import labeler_client
 from app.services.snapshot_service import snapshot_service
+from app.services.response_cache import DATASETS_AVAILABLE_KEY_PREFIX, response_cache
 from app.db.database import get_db
 from app.db.models import User, DatasetSnapshot
 from app.utils.dependencies import get_current_user
@@ -47,6 +48,9 @@ from app.schemas.dataset import (
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Labeler dataset listings are cached briefly per user + filter combination
+DATASETS_AVAILABLE_CACHE_TTL = 60
+
 
 # ============================================================================
 # Dataset List (Labeler Proxy)
@@ -72,6 +76,7 @@ class SampleDatasetInfo(BaseModel):
 async def list_sample_datasets(
     labeled: Optional[bool] = Query(default=None, description="Filter by labeled status (true=has annotations, false=unlabeled)"),
     task_type: Optional[str] = Query(default=None, description="Filter by task type (detection, segmentation, classification, etc.)"),
+    tags: Optional[str] = Query(default=None, description="Comma-separated tags; datasets must have all of them"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -83,13 +88,24 @@ async def list_sample_datasets(
     - Labeler is Single Source of Truth for dataset metadata
     - Platform only manages snapshots for training
     - task_type returns task-specific num_images and annotation_path
+    - tags are sent as a single contains-all filter (one Labeler query, not one per tag)
     """
-    try:
+    tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()] if tags else None
+    cache_key = ":".join([
+        DATASETS_AVAILABLE_KEY_PREFIX,
+        str(current_user.id),
+        str(labeled),
+        task_type or "",
+        ",".join(sorted(tag_list)) if tag_list else "",
+    ])
+
+    async def load_datasets():
         # Query Labeler API for available datasets (Phase 16.6: with task_type)
         result = await labeler_client.list_datasets(
             requesting_user_id=current_user.id,
             labeled=labeled,
-            task_type=task_type
+            task_type=task_type,
+            tags=tag_list
         )
 
         datasets = result.get("datasets", [])
@@ -101,6 +117,11 @@ async def list_sample_datasets(
 
         return datasets
 
+    try:
+        return await response_cache.get_or_set(
+            cache_key, DATASETS_AVAILABLE_CACHE_TTL, load_datasets
+        )
+
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             logger.warning("[DATASETS] Labeler returned 404")
@@ -5,14 +5,18 @@ from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
 from pydantic import BaseModel
 from pathlib import Path
 from typing import List, Optional, Dict, Any
+import asyncio
 import logging
-import json
+import mimetypes
+import orjson
 import uuid
 from datetime import datetime
 from sqlalchemy.orm import Session
 from collections import defaultdict
 
 from app.utils.dual_storage import dual_storage
+from app.services.dataset_analyzer import is_image_filename
+from app.services.response_cache import DATASETS_AVAILABLE_KEY_PREFIX, response_cache
 from app.db.database import get_db
 from app.db.models import Dataset, User
 from app.utils.dependencies import get_current_user
@@ -20,6 +24,9 @@ from app.utils.dependencies import get_current_user
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Maximum number of concurrent image uploads per request
+UPLOAD_CONCURRENCY = 32
+
 
 class FolderUploadResponse(BaseModel):
     """Response model for folder upload"""
@@ -74,6 +81,7 @@ async def upload_folder(
 
         # Analyze folder structure and find annotation.json or annotations.json
         annotation_data = None
+        annotation_raw = None  # Original annotation file bytes (uploaded as-is when unchanged)
         annotation_file = None
         image_files = []
         folder_structure = defaultdict(int)  # path -> count
@@ -88,42 +96,43 @@ async def upload_folder(
                 logger.warning(f"File without relative path: {file.filename}")
                 continue
 
+            path_parts = Path(relative_path).parts
+
             # Detect root folder name from first file
             if root_folder is None:
-                path_parts = Path(relative_path).parts
                 if len(path_parts) > 0:
                     root_folder = path_parts[0]
                     logger.info(f"Detected root folder: {root_folder}")
 
+            # Strip root folder (forward slashes for R2/S3 compatibility)
+            structure_parts = path_parts[1:] if root_folder and len(path_parts) > 1 and path_parts[0] == root_folder else path_parts
+
             # Check if it's annotation.json or annotations.json
             if relative_path.endswith('annotation.json') or relative_path.endswith('annotations.json'):
                 logger.info(f"Found annotations file at: {relative_path}")
                 try:
-                    content = await file.read()
-                    annotation_data = json.loads(content.decode('utf-8'))
-                    annotation_file = file
-                    await file.seek(0)  # Reset file pointer for upload
+                    annotation_raw = await file.read()
+                    annotation_data = orjson.loads(annotation_raw)
+                    annotation_file = file  # Only its filename is used; bytes are kept in annotation_raw
                 except Exception as e:
                     logger.error(f"Failed to parse annotations file: {e}")
                     raise HTTPException(status_code=400, detail="Invalid annotations file format")
 
             # Track folder structure (without root folder)
-            path_parts = Path(relative_path).parts
-            if len(path_parts) > 1:
-                # Strip root folder from structure tracking
-                structure_parts = path_parts[1:] if root_folder and path_parts[0] == root_folder else path_parts
-                if len(structure_parts) > 1:
-                    # Has subdirectories after root
-                    # Use forward slash for consistency
-                    folder_path = '/'.join(structure_parts[:-1])
-                    folder_structure[folder_path] += 1
-
-            # Check if it's an image
-            if file.content_type and file.content_type.startswith('image/'):
+            if len(structure_parts) > 1:
+                # Has subdirectories after root
+                # Use forward slash for consistency
+                folder_path = '/'.join(structure_parts[:-1])
+                folder_structure[folder_path] += 1
+
+            # Check if it's an image by extension: client-sent content_type is
+            # unreliable (browsers send application/octet-stream for .webp/.heic)
+            if is_image_filename(relative_path):
                 image_files.append({
                     'file': file,
                     'relative_path': relative_path,
-                    'content_type': file.content_type
+                    'path_without_root': '/'.join(structure_parts),
+                    'content_type': mimetypes.guess_type(relative_path)[0] or file.content_type
                 })
 
         if not image_files:
@@ -150,48 +159,51 @@ async def upload_folder(
 
         # Upload files to R2
         logger.info(f"Uploading {len(image_files)} files to R2...")
-        uploaded_count = 0
         image_path_mapping = {}  # Map original paths to R2 URLs
 
-        for item in image_files:
+        # Uploads are independent, RTT-bound PUTs: run them concurrently in worker
+        # threads, bounded so large folders don't exhaust the connection pool
+        upload_semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
+        async def upload_image(item: Dict[str, Any]) -> bool:
             file_obj = item['file']
             relative_path = item['relative_path']
             content_type = item['content_type']
-
-            # Strip root folder from path
-            path_without_root = relative_path
-            if root_folder:
-                path_parts = Path(relative_path).parts
-                if len(path_parts) > 1 and path_parts[0] == root_folder:
-                    # Use forward slash for R2/S3 compatibility (not Path which uses backslash on Windows)
-                    path_without_root = '/'.join(path_parts[1:])
-                    logger.debug(f"Stripped root folder: {relative_path} -> {path_without_root}")
+            path_without_root = item['path_without_root']
 
             # R2 path: datasets/{id}/{path_without_root}
             # Ensure forward slashes (replace any backslashes from Windows paths)
             storage_key = f"datasets/{dataset_id}/{path_without_root}".replace('\\', '/')
 
             # Upload to R2
-            try:
-                await file_obj.seek(0)
-                file_bytes = await file_obj.read()
-
-                success = storage.upload_bytes(
-                    file_bytes,
-                    storage_key,
-                    content_type=content_type
-                )
-
-                if success:
-                    uploaded_count += 1
-                    # Store mapping from original path to storage key (no presigned URL generation for faster upload)
-                    # Presigned URLs will be generated on-demand when images are retrieved
-                    image_path_mapping[relative_path] = storage_key
-                    image_path_mapping[path_without_root] = storage_key
-                else:
-                    logger.warning(f"Failed to upload: {relative_path}")
-            except Exception as e:
-                logger.error(f"Error uploading {relative_path}: {e}")
+            async with upload_semaphore:
+                try:
+                    # Image files are read exactly once, here (the scan pass only
+                    # reads annotation files), so no seek is needed
+                    file_bytes = await file_obj.read()
+
+                    success = await asyncio.to_thread(
+                        storage.upload_bytes,
+                        file_bytes,
+                        storage_key,
+                        content_type=content_type
+                    )
+                except Exception as e:
+                    logger.error(f"Error uploading {relative_path}: {e}")
+                    return False
+
+            if not success:
+                logger.warning(f"Failed to upload: {relative_path}")
+                return False
+
+            # Store mapping from original path to storage key (no presigned URL generation for faster upload)
+            # Presigned URLs will be generated on-demand when images are retrieved
+            image_path_mapping[relative_path] = storage_key
+            image_path_mapping[path_without_root] = storage_key
+            return True
+
+        results = await asyncio.gather(*(upload_image(item) for item in image_files))
+        uploaded_count = sum(results)
 
         logger.info(f"Uploaded {uploaded_count}/{len(image_files)} files")
 
@@ -200,40 +212,46 @@ async def upload_folder(
             # Update image paths in annotations to storage keys (not presigned URLs)
             logger.info("Updating image paths in annotations to storage keys...")
             updated_annotations = []
+            rewritten_count = 0
 
             for ann in annotation_data.get('annotations', []):
-                updated_ann = ann.copy()
                 original_path = ann.get('image_path', '')
 
                 # Try to find storage key for this image
-                if original_path in image_path_mapping:
-                    updated_ann['image_path'] = image_path_mapping[original_path]
-                    logger.debug(f"Updated path: {original_path} -> {updated_ann['image_path']}")
-                else:
+                storage_key = image_path_mapping.get(original_path)
+                if storage_key is None:
                     # Try without root folder
                     path_parts = Path(original_path).parts
                     if root_folder and len(path_parts) > 0 and path_parts[0] == root_folder:
                         # Use forward slash for R2/S3 compatibility
-                        path_without_root = '/'.join(path_parts[1:])
-                        if path_without_root in image_path_mapping:
-                            updated_ann['image_path'] = image_path_mapping[path_without_root]
-                            logger.debug(f"Updated path: {original_path} -> {updated_ann['image_path']}")
-                        else:
-                            logger.warning(f"No storage key found for image: {original_path}")
-                    else:
-                        logger.warning(f"No storage key found for image: {original_path}")
+                        storage_key = image_path_mapping.get('/'.join(path_parts[1:]))
 
-                updated_annotations.append(updated_ann)
-
-            # Update annotation_data with new paths
-            annotation_data['annotations'] = updated_annotations
+                if storage_key is None:
+                    logger.warning(f"No storage key found for image: {original_path}")
+                    updated_annotations.append(ann)
+                elif storage_key == original_path:
+                    updated_annotations.append(ann)
+                else:
+                    updated_ann = ann.copy()
+                    updated_ann['image_path'] = storage_key
+                    updated_annotations.append(updated_ann)
+                    rewritten_count += 1
+                    logger.debug(f"Updated path: {original_path} -> {storage_key}")
 
             # Determine filename (annotations.json or annotation.json)
             annotation_filename = "annotations.json" if annotation_file.filename.endswith("annotations.json") else "annotation.json"
             annotation_storage_key = f"datasets/{dataset_id}/{annotation_filename}"
-            annotation_bytes = json.dumps(annotation_data, indent=2).encode('utf-8')
 
-            storage.upload_bytes(
+            if rewritten_count:
+                # Update annotation_data with new paths and re-encode
+                annotation_data['annotations'] = updated_annotations
+                annotation_bytes = orjson.dumps(annotation_data)
+            else:
+                # Nothing changed: upload the original bytes, skipping the encode round-trip
+                annotation_bytes = annotation_raw
+
+            await asyncio.to_thread(
+                storage.upload_bytes,
                 annotation_bytes,
                 annotation_storage_key,
                 content_type="application/json"
@@ -252,6 +270,9 @@ async def upload_folder(
         db.commit()
         db.refresh(dataset)
 
+        # Dataset image counts/labels changed: drop cached dataset listings
+        await response_cache.delete_pattern(f"{DATASETS_AVAILABLE_KEY_PREFIX}:*")
+
         logger.info(f"Dataset updated in DB: {dataset_id} - added {len(image_files)} images")
 
         return FolderUploadResponse(
@@ -12,11 +12,14 @@ from fastapi.responses import FileResponse
 from pathlib import Path
 import subprocess
 import json
+import logging
 import os
 import shutil
 import uuid
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/image-tools", tags=["Image Tools"])
 
 
@@ -101,7 +104,7 @@ async def super_resolution(
             "--use_pretrained"
         ]
 
-        print(f"[INFO] Running super-resolution with model: {model_name}")
+        logger.info(f"[IMAGE_TOOLS] Running super-resolution with model: {model_name}")
 
         # Run inference
         result = subprocess.run(
@@ -113,7 +116,7 @@ async def super_resolution(
 
         if result.returncode != 0:
             error_msg = result.stderr or "Super-resolution failed"
-            print(f"[ERROR] Super-resolution failed: {error_msg}")
+            logger.error(f"[IMAGE_TOOLS] Super-resolution failed: {error_msg}")
             raise HTTPException(
                 status_code=500,
                 detail=f"Super-resolution failed: {error_msg}"
@@ -146,7 +149,7 @@ async def super_resolution(
             }
 
         except json.JSONDecodeError as e:
-            print(f"[ERROR] Failed to parse output: {result.stdout}")
+            logger.error(f"[IMAGE_TOOLS] Failed to parse output: {result.stdout}")
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to parse result: {str(e)}"
@@ -161,9 +164,7 @@ async def super_resolution(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"[ERROR] Super-resolution error: {e}")
-        traceback.print_exc()
+        logger.error(f"[IMAGE_TOOLS] Super-resolution error: {e}", exc_info=True)
         shutil.rmtree(temp_dir, ignore_errors=True)
         raise HTTPException(
             status_code=500,
@@ -243,7 +244,7 @@ async def get_result_image(
         image_path = Path(settings.UPLOAD_DIR) / "image_tools_temp" / session_id / "inference_results" / filename
 
     if not image_path.exists():
-        print(f"[ERROR] Image not found at: {image_path}")
+        logger.error(f"[IMAGE_TOOLS] Image not found at: {image_path}")
         raise HTTPException(
             status_code=404,
             detail=f"Result image not found: {filename}"
@@ -287,7 +288,7 @@ async def cleanup_session(session_id: str):
             # Safety check
             if "image_tools_temp" in str(session_dir):
                 shutil.rmtree(session_dir)
-                print(f"[INFO] Cleaned up session: {session_id}")
+                logger.info(f"[IMAGE_TOOLS] Cleaned up session: {session_id}")
                 return {"status": "cleaned", "session_id": session_id}
             else:
                 raise HTTPException(
@@ -300,9 +301,7 @@ async def cleanup_session(session_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"[ERROR] Cleanup failed for session {session_id}: {e}")
-        traceback.print_exc()
+        logger.error(f"[IMAGE_TOOLS] Cleanup failed for session {session_id}: {e}", exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Cleanup failed: {str(e)}"
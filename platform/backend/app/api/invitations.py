@@ -1,6 +1,6 @@
 """Invitation API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from typing import Optional
@@ -21,6 +21,7 @@ from app.schemas.invitation import (
 )
 from app.utils.dependencies import get_current_active_user
 from app.services.email_service import get_email_service
+from app.services.response_cache import invalidate_admin_lists, invalidate_project_lists
 from app.core.security import get_password_hash
 
 router = APIRouter(prefix="/invitations", tags=["invitations"])
@@ -102,6 +103,7 @@ def get_invitation_info(
 @router.post("/accept", response_model=dict)
 def accept_invitation(
     request: AcceptInvitationRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user_db: Session = Depends(get_user_db)
 ):
@@ -193,6 +195,10 @@ def accept_invitation(
     invitation.accepted_at = datetime.utcnow()
 
     db.commit()
+    if not existing_user:
+        background_tasks.add_task(invalidate_admin_lists)
+    if invitation.invitation_type == InvitationType.PROJECT:
+        background_tasks.add_task(invalidate_project_lists)
 
     return {
         "message": "Invitation accepted successfully",
@@ -1,28 +1,52 @@
 """Projects API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import delete, exists, func, literal, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from typing import List
+from datetime import datetime
 
 from app.db.database import get_db, get_user_db
-from app.db.models import Project, TrainingJob, User, ProjectMember, InvitationType, UserRole
+from app.db.models import (
+    Project, TrainingJob, User, ProjectMember, Invitation, InvitationStatus, InvitationType, UserRole,
+    Experiment, ExperimentStar, ExperimentNote, TrainingMetric, TrainingLog,
+    ValidationResult, ValidationImageResult, TestRun, TestImageResult,
+    InferenceJob, InferenceResult,
+)
 from app.schemas.project import (
     ProjectCreate,
     ProjectUpdate,
     ProjectResponse,
     ProjectWithExperimentsResponse,
 )
+from app.schemas.training import TrainingJobResponse
 from app.utils.dependencies import get_current_active_user
+from app.services.response_cache import (
+    PROJECTS_LIST_KEY_PREFIX,
+    invalidate_admin_lists,
+    invalidate_project_lists,
+    response_cache,
+)
 from app.api.invitations import create_invitation
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, TypeAdapter
 
 router = APIRouter(tags=["projects"])
 
+# Per-user project list cache lifetime (seconds); also bounds experiment_count staleness
+PROJECTS_LIST_CACHE_TTL = 60
+
+# Validates a whole experiment list in one pydantic-core call
+_TRAINING_JOB_LIST_ADAPTER = TypeAdapter(List[TrainingJobResponse])
+
 
 def check_project_access(project_id: int, user_id: int, db: Session) -> bool:
     """Check if user has access to project (owner or member)."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    # Only the owner id is needed, so don't hydrate the full Project row
+    project = db.query(Project.user_id).filter(Project.id == project_id).first()
     if not project:
         return False
 
@@ -31,7 +55,7 @@ def check_project_access(project_id: int, user_id: int, db: Session) -> bool:
         return True
 
     # Check if member
-    is_member = db.query(ProjectMember).filter(
+    is_member = db.query(ProjectMember.id).filter(
         ProjectMember.project_id == project_id,
         ProjectMember.user_id == user_id
     ).first()
@@ -39,6 +63,75 @@ def check_project_access(project_id: int, user_id: int, db: Session) -> bool:
     return is_member is not None
 
 
+def _is_member_clause(user_id: int):
+    """EXISTS clause: user is a member of the project in the enclosing query."""
+    return exists().where(
+        ProjectMember.project_id == Project.id,
+        ProjectMember.user_id == user_id
+    )
+
+
+def _raise_project_not_accessible(project_id: int, db: Session, detail: str):
+    """Raise 404 if the project doesn't exist, otherwise 403.
+
+    Called only after a permission-filtered lookup missed, so the common
+    authorized path never pays for this extra query.
+    """
+    if not db.query(Project.id).filter(Project.id == project_id).first():
+        raise HTTPException(status_code=404, detail="Project not found")
+    raise HTTPException(status_code=403, detail=detail)
+
+
+def _bulk_delete_project(project_id: int, db: Session) -> int:
+    """Delete a project and everything its ORM cascades covered, in bulk.
+
+    db.delete(project) loads every training job, metric, log, validation
+    row, etc. into the session and deletes them one row at a time. This
+    issues one set-based DELETE per table instead, children first, covering
+    the same relationship cascades (tables with ON DELETE CASCADE on
+    training_jobs, e.g. export_jobs, are still left to the database).
+    Does not commit.
+
+    Returns:
+        Number of training jobs (experiments) deleted
+    """
+    experiment_ids = select(Experiment.id).where(Experiment.project_id == project_id)
+    in_project = or_(TrainingJob.project_id == project_id, TrainingJob.experiment_id.in_(experiment_ids))
+    job_ids = select(TrainingJob.id).where(in_project)
+    test_run_ids = select(TestRun.id).where(TestRun.training_job_id.in_(job_ids))
+    inference_job_ids = select(InferenceJob.id).where(InferenceJob.training_job_id.in_(job_ids))
+
+    # Nothing deleted here is needed from the session afterwards
+    options = {"synchronize_session": False}
+
+    job_children = [
+        delete(ValidationImageResult).where(ValidationImageResult.job_id.in_(job_ids)),
+        delete(ValidationResult).where(ValidationResult.job_id.in_(job_ids)),
+        delete(TestImageResult).where(TestImageResult.test_run_id.in_(test_run_ids)),
+        delete(TestRun).where(TestRun.training_job_id.in_(job_ids)),
+        delete(InferenceResult).where(InferenceResult.inference_job_id.in_(inference_job_ids)),
+        delete(InferenceJob).where(InferenceJob.training_job_id.in_(job_ids)),
+        delete(TrainingMetric).where(TrainingMetric.job_id.in_(job_ids)),
+        delete(TrainingLog).where(TrainingLog.job_id.in_(job_ids)),
+    ]
+    for stmt in job_children:
+        db.execute(stmt, execution_options=options)
+
+    deleted_jobs = db.execute(delete(TrainingJob).where(in_project), execution_options=options).rowcount
+
+    project_rows = [
+        delete(ExperimentStar).where(ExperimentStar.experiment_id.in_(experiment_ids)),
+        delete(ExperimentNote).where(ExperimentNote.experiment_id.in_(experiment_ids)),
+        delete(Experiment).where(Experiment.project_id == project_id),
+        delete(ProjectMember).where(ProjectMember.project_id == project_id),
+        delete(Project).where(Project.id == project_id),
+    ]
+    for stmt in project_rows:
+        db.execute(stmt, execution_options=options)
+
+    return deleted_jobs
+
+
 class ProjectMemberResponse(BaseModel):
     """Schema for project member response."""
     user_id: int
@@ -63,19 +156,12 @@ class MemberInviteRequest(BaseModel):
 @router.post("", response_model=ProjectResponse)
 def create_project(
     project: ProjectCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Create a new project."""
 
-    # Check if project with same name already exists for this user
-    existing = db.query(Project).filter(
-        Project.name == project.name,
-        Project.user_id == current_user.id
-    ).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="Project with this name already exists")
-
     db_project = Project(
         name=project.name,
         description=project.description,
@@ -83,84 +169,89 @@ def create_project(
         user_id=current_user.id,  # Set the owner
     )
 
+    # Duplicate names are rejected by the projects.name unique constraint
+    # (no preflight SELECT, which would also race with concurrent creates)
     db.add(db_project)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Project with this name already exists")
     db.refresh(db_project)
+    background_tasks.add_task(invalidate_admin_lists)
+    background_tasks.add_task(invalidate_project_lists)
 
     return db_project
 
 
 @router.get("", response_model=List[ProjectWithExperimentsResponse])
-def list_projects(
+async def list_projects(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """List all projects owned by or shared with the current user with experiment counts."""
+    """List all projects owned by or shared with the current user with experiment counts.
+
+    Cached per user for PROJECTS_LIST_CACHE_TTL seconds; project and
+    membership changes invalidate the cache.
+    """
+    projects = await response_cache.get_or_set(
+        f"{PROJECTS_LIST_KEY_PREFIX}:{current_user.id}",
+        PROJECTS_LIST_CACHE_TTL,
+        lambda: run_in_threadpool(_load_user_projects, db, current_user.id),
+    )
+    # Cached rows were validated against the response model when loaded;
+    # render them directly instead of re-validating on every hit
+    return ORJSONResponse(projects)
+
+
+def _load_user_projects(db: Session, user_id: int) -> list:
+    """Build the project list for a user (blocking DB queries)."""
+    # Per-project experiment count as a correlated scalar subquery: each count is
+    # a probe on ix_training_jobs_project_created, with no join + GROUP BY over all jobs
+    exp_count_sq = (
+        select(func.count(TrainingJob.id))
+        .where(TrainingJob.project_id == Project.id)
+        .correlate(Project)
+        .scalar_subquery()
+    )
+
+    # Select only the response columns (labels match ProjectWithExperimentsResponse
+    # fields) so rows validate directly via from_attributes, without ORM hydration
+    columns = (
+        Project.id,
+        Project.name,
+        Project.description,
+        Project.task_type,
+        Project.created_at,
+        Project.updated_at,
+        exp_count_sq.label("experiment_count"),
+    )
 
     # Get owned projects
     owned_projects = (
-        db.query(
-            Project,
-            func.count(TrainingJob.id).label("experiment_count")
-        )
-        .filter(Project.user_id == current_user.id)
-        .outerjoin(TrainingJob, TrainingJob.project_id == Project.id)
-        .group_by(Project.id)
+        db.query(*columns, literal("owner").label("user_role"))
+        .filter(Project.user_id == user_id)
         .all()
     )
 
     # Get projects where user is a member (with role)
     member_projects = (
-        db.query(
-            Project,
-            func.count(TrainingJob.id).label("experiment_count"),
-            ProjectMember.role
-        )
+        db.query(*columns, ProjectMember.role.label("user_role"))
         .join(ProjectMember, ProjectMember.project_id == Project.id)
-        .filter(ProjectMember.user_id == current_user.id)
-        .outerjoin(TrainingJob, TrainingJob.project_id == Project.id)
-        .group_by(Project.id, ProjectMember.role)
+        .filter(ProjectMember.user_id == user_id)
         .all()
     )
 
-    # Format owned projects
+    # Owned projects first; a project is listed once even if the owner is also a member
     result = []
     seen_ids = set()
 
-    for project, exp_count in owned_projects:
-        if project.id not in seen_ids:
-            seen_ids.add(project.id)
-            result.append(
-                ProjectWithExperimentsResponse(
-                    id=project.id,
-                    name=project.name,
-                    description=project.description,
-                    task_type=project.task_type,
-                    created_at=project.created_at,
-                    updated_at=project.updated_at,
-                    experiment_count=exp_count,
-                    user_role="owner"
-                )
-            )
-
-    # Format member projects
-    for project, exp_count, role in member_projects:
-        if project.id not in seen_ids:
-            seen_ids.add(project.id)
-            result.append(
-                ProjectWithExperimentsResponse(
-                    id=project.id,
-                    name=project.name,
-                    description=project.description,
-                    task_type=project.task_type,
-                    created_at=project.created_at,
-                    updated_at=project.updated_at,
-                    experiment_count=exp_count,
-                    user_role=role  # Use actual role from ProjectMember
-                )
-            )
+    for row in (*owned_projects, *member_projects):
+        if row.id not in seen_ids:
+            seen_ids.add(row.id)
+            result.append(ProjectWithExperimentsResponse.model_validate(row))
 
-    return result
+    return jsonable_encoder(result)
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
@@ -171,13 +262,13 @@ def get_project(
 ):
     """Get a specific project by ID."""
 
-    project = db.query(Project).filter(Project.id == project_id).first()
+    # Permission (owner or member) is part of the lookup
+    project = db.query(Project).filter(
+        Project.id == project_id,
+        or_(Project.user_id == current_user.id, _is_member_clause(current_user.id))
+    ).first()
     if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    # Check permission (owner or member)
-    if not check_project_access(project_id, current_user.id, db):
-        raise HTTPException(status_code=403, detail="Not authorized to access this project")
+        _raise_project_not_accessible(project_id, db, "Not authorized to access this project")
 
     return project
 
@@ -186,58 +277,76 @@ def get_project(
 def update_project(
     project_id: int,
     project_update: ProjectUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Update a project."""
 
-    db_project = db.query(Project).filter(Project.id == project_id).first()
-    if not db_project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    # Check permission
-    if db_project.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized to update this project")
-
     # Update fields if provided
-    if project_update.name is not None:
-        # Check if new name conflicts with existing project for this user
-        existing = db.query(Project).filter(
-            Project.name == project_update.name,
-            Project.id != project_id,
-            Project.user_id == current_user.id
-        ).first()
-        if existing:
-            raise HTTPException(status_code=400, detail="Project with this name already exists")
-        db_project.name = project_update.name
-
-    if project_update.description is not None:
-        db_project.description = project_update.description
-
-    if project_update.task_type is not None:
-        db_project.task_type = project_update.task_type
+    values = {
+        field: value
+        for field, value in project_update.model_dump().items()
+        if value is not None
+    }
 
-    db.commit()
-    db.refresh(db_project)
+    columns = (
+        Project.id,
+        Project.name,
+        Project.description,
+        Project.task_type,
+        Project.user_id,
+        Project.created_at,
+        Project.updated_at,
+    )
+    owned = (Project.id == project_id, Project.user_id == current_user.id)
+
+    if not values:
+        # Nothing to change (don't bump updated_at): return the project as-is
+        row = db.execute(select(*columns).where(*owned)).first()
+        if not row:
+            _raise_project_not_accessible(project_id, db, "Not authorized to update this project")
+        return ProjectResponse.model_validate(row)
+
+    # Only the owner may update: one UPDATE ... RETURNING with the permission in
+    # WHERE; a name conflict is rejected by the unique constraint
+    stmt = (
+        update(Project)
+        .where(*owned)
+        .values(**values)
+        .returning(*columns)
+        .execution_options(synchronize_session=False)
+    )
+    try:
+        row = db.execute(stmt).first()
+        if not row:
+            _raise_project_not_accessible(project_id, db, "Not authorized to update this project")
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Project with this name already exists")
+    background_tasks.add_task(invalidate_admin_lists)
+    background_tasks.add_task(invalidate_project_lists)
 
-    return db_project
+    return ProjectResponse.model_validate(row)
 
 
 @router.delete("/{project_id}")
 def delete_project(
     project_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Delete a project and all its experiments."""
 
-    db_project = db.query(Project).filter(Project.id == project_id).first()
+    # Only the owner may delete; permission is part of the lookup
+    db_project = db.query(Project).filter(
+        Project.id == project_id,
+        Project.user_id == current_user.id
+    ).first()
     if not db_project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    # Check permission
-    if db_project.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized to delete this project")
+        _raise_project_not_accessible(project_id, db, "Not authorized to delete this project")
 
     # Prevent deletion of default "Uncategorized" project
     if db_project.name == "Uncategorized":
@@ -246,15 +355,16 @@ def delete_project(
             detail="Cannot delete the default 'Uncategorized' project"
         )
 
-    # Get experiment count
-    exp_count = db.query(TrainingJob).filter(TrainingJob.project_id == project_id).count()
-
-    # Delete project (cascade will delete experiments)
-    db.delete(db_project)
+    # Delete project and its experiments with set-based DELETEs; the job
+    # DELETE's rowcount is the experiment count, so no separate COUNT query
+    project_name = db_project.name
+    exp_count = _bulk_delete_project(project_id, db)
     db.commit()
+    background_tasks.add_task(invalidate_admin_lists)
+    background_tasks.add_task(invalidate_project_lists)
 
     return {
-        "message": f"Project '{db_project.name}' deleted successfully",
+        "message": f"Project '{project_name}' deleted successfully",
         "deleted_experiments": exp_count
     }
 
@@ -267,25 +377,24 @@ def get_project_experiments(
 ):
     """Get all experiments for a specific project."""
 
-    # Check if project exists
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    # Check permission (owner or member)
-    if not check_project_access(project_id, current_user.id, db):
-        raise HTTPException(status_code=403, detail="Not authorized to access this project")
-
-    # Get all experiments for this project
+    # Fetch experiments with the access check (owner or member) in the same query
     experiments = (
         db.query(TrainingJob)
-        .filter(TrainingJob.project_id == project_id)
+        .join(Project, Project.id == TrainingJob.project_id)
+        .filter(
+            TrainingJob.project_id == project_id,
+            or_(Project.user_id == current_user.id, _is_member_clause(current_user.id))
+        )
         .order_by(TrainingJob.created_at.desc())
         .all()
     )
 
-    from app.schemas.training import TrainingJobResponse
-    return [TrainingJobResponse.model_validate(exp) for exp in experiments]
+    if not experiments:
+        # Miss path only: tell a missing or forbidden project from an empty one
+        if not check_project_access(project_id, current_user.id, db):
+            _raise_project_not_accessible(project_id, db, "Not authorized to access this project")
+
+    return _TRAINING_JOB_LIST_ADAPTER.validate_python(experiments, from_attributes=True)
 
 
 @router.get("/{project_id}/members", response_model=List[ProjectMemberResponse])
@@ -346,6 +455,7 @@ def get_project_members(
 def invite_project_member(
     project_id: int,
     invite: MemberInviteRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -398,7 +508,6 @@ def invite_project_member(
             raise HTTPException(status_code=400, detail="User is already a member of this project")
 
         # Create membership
-        from datetime import datetime
         new_member = ProjectMember(
             project_id=project_id,
             user_id=user.id,
@@ -410,6 +519,7 @@ def invite_project_member(
         db.add(new_member)
         db.commit()
         db.refresh(new_member)
+        background_tasks.add_task(invalidate_project_lists)
 
         return {
             "message": "Member added successfully",
@@ -423,7 +533,6 @@ def invite_project_member(
         # User doesn't exist - Create Invitation and send email
 
         # Check if there's already a pending invitation for this email
-        from app.db.models import Invitation, InvitationStatus
         existing_invitation = db.query(Invitation).filter(
             Invitation.project_id == project_id,
             Invitation.invitee_email == invite.email,
@@ -465,6 +574,7 @@ def invite_project_member(
 def remove_project_member(
     project_id: int,
     user_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -494,5 +604,6 @@ def remove_project_member(
 
     db.delete(member)
     db.commit()
+    background_tasks.add_task(invalidate_project_lists)
 
     return {"message": "Member removed successfully", "user_id": user_id}
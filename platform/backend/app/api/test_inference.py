@@ -110,9 +110,7 @@ async def _run_test_task_async(test_run_id: int):
         # Status will be updated by callback from evaluate.py
 
     except Exception as e:
-        logger.error(f"[TEST] Test run {test_run_id} error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error(f"[TEST] Test run {test_run_id} error: {e}", exc_info=True)
 
         try:
             test_run.status = "failed"
@@ -214,9 +212,7 @@ async def _run_inference_task_async(inference_job_id: int):
         # Status will be updated by callback from predict.py
 
     except Exception as e:
-        logger.error(f"[INFERENCE] Job {inference_job_id} error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error(f"[INFERENCE] Job {inference_job_id} error: {e}", exc_info=True)
 
         try:
             inference_job.status = "failed"
@@ -1350,9 +1346,7 @@ async def upload_inference_images(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        logger.error(f"Image upload to S3 failed: {e}")
-        logger.error(traceback.format_exc())
+        logger.error(f"Image upload to S3 failed: {e}", exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to upload images to S3: {str(e)}"
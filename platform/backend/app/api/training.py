@@ -11,6 +11,7 @@ from app.db.database import get_db
 from app.db import models
 from app.schemas import training
 from app.core.config import settings
+from app.services.response_cache import invalidate_admin_lists, invalidate_project_lists
 from app.services.websocket_manager import get_websocket_manager
 from app.utils.dependencies import get_current_user
 
@@ -316,6 +317,9 @@ async def create_training_job(
     db.add(job)
     db.commit()
     db.refresh(job)
+    # The project's experiment_count changed
+    await invalidate_admin_lists()
+    await invalidate_project_lists()
 
     # Phase 12.6: Create dataset snapshot before starting workflow
     if dataset_id:
@@ -380,7 +384,7 @@ async def create_training_job(
 @router.get("/jobs/{job_id}", response_model=training.TrainingJobResponse)
 async def get_training_job(job_id: int, db: Session = Depends(get_db)):
     """Get a training job by ID."""
-    job = db.query(models.TrainingJob).filter(models.TrainingJob.id == job_id).first()
+    job = db.get(models.TrainingJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Training job not found")
 
@@ -397,7 +401,7 @@ async def get_training_job(job_id: int, db: Session = Depends(get_db)):
 @router.get("/jobs/{job_id}/status", response_model=training.TrainingStatusResponse)
 async def get_training_status(job_id: int, db: Session = Depends(get_db)):
     """Get training job status with latest metrics."""
-    job = db.query(models.TrainingJob).filter(models.TrainingJob.id == job_id).first()
+    job = db.get(models.TrainingJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Training job not found")
 
@@ -423,7 +427,7 @@ async def get_training_metrics(
     db: Session = Depends(get_db),
 ):
     """Get training metrics for a job."""
-    job = db.query(models.TrainingJob).filter(models.TrainingJob.id == job_id).first()
+    job = db.get(models.TrainingJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Training job not found")
 
@@ -446,7 +450,7 @@ async def get_metric_schema(job_id: int, db: Session = Depends(get_db)):
     Returns a schema describing available metrics, their types,
     and the primary metric configuration.
     """
-    job = db.query(models.TrainingJob).filter(models.TrainingJob.id == job_id).first()
+    job = db.get(models.TrainingJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Training job not found")
 
@@ -505,7 +509,7 @@ async def start_training_job(
         resume: If True, resume training from checkpoint (restore optimizer/scheduler state).
                 If False, only load model weights.
     """
-    job = db.query(models.TrainingJob).filter(models.TrainingJob.id == job_id).first()
+    job = db.get(models.TrainingJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Training job not found")
 
@@ -528,9 +532,6 @@ async def start_training_job(
         # TODO: Optional clear_history parameter to clear metrics/logs
         # clear_history = request.query_params.get('clear_history', 'false').lower() == 'true'
 
-        db.commit()
-        db.refresh(job)
-
     # Phase 11.5.5: Resolve split configuration and create snapshot
     if job.dataset_id:
         try:
@@ -554,7 +555,6 @@ async def start_training_job(
             )
             if snapshot_id:
                 job.dataset_snapshot_id = snapshot_id
-                db.commit()
                 logger.info(f"[JOB {job_id}] Using dataset snapshot: {snapshot_id}")
             else:
                 logger.warning(f"[JOB {job_id}] No snapshot created")
@@ -569,6 +569,9 @@ async def start_training_job(
                 detail=f"Failed to create dataset snapshot: {str(e)}"
             )
 
+    # Commit the reset and snapshot together, before the workflow reads the job
+    db.commit()
+
     # Phase 12: Start training (Temporal Workflow or Direct Subprocess)
     try:
         if settings.TRAINING_MODE == "subprocess":
@@ -654,7 +657,7 @@ async def cancel_training_job(job_id: int, db: Session = Depends(get_db)):
     """
     from app.core.training_manager import get_training_manager
 
-    job = db.query(models.TrainingJob).filter(models.TrainingJob.id == job_id).first()
+    job = db.get(models.TrainingJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Training job not found")
 
@@ -689,7 +692,7 @@ async def restart_training_job(job_id: int, db: Session = Depends(get_db)):
     Resets the job status to 'pending' and clears previous training data.
     The job configuration remains the same.
     """
-    job = db.query(models.TrainingJob).filter(models.TrainingJob.id == job_id).first()
+    job = db.get(models.TrainingJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Training job not found")
 
@@ -743,7 +746,7 @@ async def get_training_logs(
         limit: Maximum number of log entries to return (default: 500)
         log_type: Filter by log type ('stdout' or 'stderr'), optional
     """
-    job = db.query(models.TrainingJob).filter(models.TrainingJob.id == job_id).first()
+    job = db.get(models.TrainingJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Training job not found")
 
@@ -788,7 +791,7 @@ async def get_training_logs_from_loki(
     from datetime import datetime, timedelta
 
     # Verify job exists
-    job = db.query(models.TrainingJob).filter(models.TrainingJob.id == job_id).first()
+    job = db.get(models.TrainingJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Training job not found")
 
@@ -874,7 +877,7 @@ async def get_clearml_metrics(job_id: int, db: Session = Depends(get_db)):
     plus primary metric information and task URL.
     """
     # Verify job exists
-    job = db.query(models.TrainingJob).filter(models.TrainingJob.id == job_id).first()
+    job = db.get(models.TrainingJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Training job not found")
 
@@ -912,7 +915,7 @@ async def get_clearml_task_info(job_id: int, db: Session = Depends(get_db)):
     Returns task status, configuration, and web UI link.
     """
     # Verify job exists
-    job = db.query(models.TrainingJob).filter(models.TrainingJob.id == job_id).first()
+    job = db.get(models.TrainingJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Training job not found")
 
@@ -1442,7 +1445,7 @@ async def get_job_checkpoints(
     """
     try:
         # Get training job
-        job = db.query(models.TrainingJob).filter(models.TrainingJob.id == job_id).first()
+        job = db.get(models.TrainingJob, job_id)
         if not job:
             raise HTTPException(status_code=404, detail="Training job not found")
 
@@ -1546,7 +1549,7 @@ async def stop_training_job(
     """
     try:
         # Get training job
-        job = db.query(models.TrainingJob).filter(models.TrainingJob.id == job_id).first()
+        job = db.get(models.TrainingJob, job_id)
 
         if not job:
             raise HTTPException(
@@ -1723,7 +1726,7 @@ async def get_checkpoint_upload_url(
     """
     try:
         # Verify job exists
-        job = db.query(models.TrainingJob).filter(models.TrainingJob.id == job_id).first()
+        job = db.get(models.TrainingJob, job_id)
         if not job:
             logger.error(f"[CHECKPOINT] Job {job_id} not found")
             raise HTTPException(status_code=404, detail="Training job not found")
@@ -36,6 +36,16 @@ class Settings(BaseSettings):
     # If not set, will use separate SQLite in __init__
     USER_DATABASE_URL: Optional[str] = None
 
+    # Worker threads for sync (def) route handlers and run_in_threadpool calls
+    # AnyIO defaults to 40, which caps concurrent DB-bound requests per process
+    THREADPOOL_MAX_WORKERS: int = 100
+
+    # Connection pool (PostgreSQL only; applied to both Platform and User DB engines)
+    DB_POOL_SIZE: int = 20  # Persistent connections per engine
+    DB_MAX_OVERFLOW: int = 10  # Extra connections allowed under burst load
+    DB_POOL_RECYCLE: int = 3600  # Seconds before a connection is replaced (avoids server-side idle drops)
+    DB_QUERY_CACHE_SIZE: int = 1200  # Compiled SQL cache entries per engine (SQLAlchemy default: 500)
+
     # Redis (Phase 5: Multi-backend state management)
     # If not set, will default to localhost in main.py
     REDIS_URL: Optional[str] = "redis://localhost:6379/0"
@@ -45,6 +55,8 @@ class Settings(BaseSettings):
     LLM_PROVIDER: str = "openai"  # Options: "openai", "gemini"
     LLM_MODEL: str = "gpt-4o-mini"  # OpenAI: gpt-4o-mini, Gemini: gemini-2.0-flash-exp
     LLM_TEMPERATURE: float = 0.0
+    LLM_MODEL_HEAVY: Optional[str] = None  # Larger model retried on ambiguous parses (unset or empty disables)
+    LLM_RESPONSE_CACHE_TTL: int = 3600  # Seconds to reuse a parse for an identical prompt (0 disables)
 
     # OpenAI Compatible API (when LLM_PROVIDER=openai)
     # Supports: OpenAI, Azure OpenAI, LocalAI, Ollama, vLLM, etc.
@@ -70,6 +82,7 @@ class Settings(BaseSettings):
     OUTPUT_DIR: str = "./data/outputs"
     MODEL_DIR: str = "./data/models"
     LOG_DIR: str = "./data/logs"
+    LOG_LEVEL: str = "INFO"  # Root log level (DEBUG enables per-turn chat/LLM traces)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -15,6 +15,7 @@ Architecture:
 
 import logging
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
@@ -211,6 +212,7 @@ class TrainingManager(ABC):
         pass
 
 
+@lru_cache(maxsize=1)
 def get_training_manager() -> TrainingManager:
     """
     Factory function to get TrainingManager implementation.
@@ -219,6 +221,10 @@ def get_training_manager() -> TrainingManager:
     - "subprocess": SubprocessTrainingManager (Tier 0)
     - "kubernetes": KubernetesTrainingManager (Tier 1+)
 
+    The instance is created once per process and shared: construction loads
+    the K8s config and job templates, and the subprocess manager tracks its
+    running processes in memory.
+
     Returns:
         TrainingManager instance
 
@@ -236,9 +242,9 @@ def get_training_manager() -> TrainingManager:
     mode = settings.TRAINING_MODE.lower()
 
     if mode == "subprocess":
-        from app.core.training_managers.subprocess_manager import SubprocessTrainingManager
+        from app.core.training_managers.subprocess_manager import get_training_subprocess_manager
         logger.info("[TrainingManager] Using SubprocessTrainingManager (Tier 0)")
-        return SubprocessTrainingManager()
+        return get_training_subprocess_manager()
 
     elif mode == "kubernetes":
         from app.core.training_managers.kubernetes_manager import KubernetesTrainingManager
@@ -23,12 +23,14 @@ import json
 import logging
 import os
 import re
+import threading
+import time
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 
 import yaml
 from jinja2 import Template
-from kubernetes import client, config
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
 
 from app.core.training_manager import TrainingManager
@@ -257,6 +259,12 @@ class KubernetesTrainingManager(TrainingManager):
             "INTERNAL_BUCKET_CHECKPOINTS",
         ]
 
+        # Training job status, pushed by a background watch on the namespace's
+        # Jobs (one long-lived stream instead of a GET per status request)
+        self.status_watch_enabled = os.getenv("K8S_STATUS_WATCH", "true").lower() == "true"
+        self._status_cache: Dict[int, Dict[str, Any]] = {}
+        self._status_watch_thread: Optional[threading.Thread] = None
+
         # Load job templates from ConfigMap
         self._load_job_templates()
 
@@ -837,7 +845,16 @@ class KubernetesTrainingManager(TrainingManager):
             return False
 
     def get_training_status(self, job_id: int) -> Optional[Dict[str, Any]]:
-        """Get status of a training job from K8s."""
+        """Get status of a training job from K8s.
+
+        Served from the watch-fed status cache; only jobs the watch has not
+        reported yet cost a request to the API server.
+        """
+        self._ensure_status_watch()
+        cached = self._status_cache.get(job_id)
+        if cached is not None:
+            return dict(cached)
+
         try:
             jobs = self.batch_api.list_namespaced_job(
                 namespace=self.namespace,
@@ -847,30 +864,7 @@ class KubernetesTrainingManager(TrainingManager):
             if not jobs.items:
                 return None
 
-            job = jobs.items[0]
-            status = job.status
-
-            if status.succeeded and status.succeeded > 0:
-                state = "completed"
-            elif status.failed and status.failed > 0:
-                state = "failed"
-            elif status.active and status.active > 0:
-                state = "running"
-            else:
-                state = "pending"
-
-            return {
-                "job_id": job_id,
-                "k8s_job_name": job.metadata.name,
-                "status": state,
-                "active": status.active or 0,
-                "succeeded": status.succeeded or 0,
-                "failed": status.failed or 0,
-                "start_time": status.start_time.isoformat() if status.start_time else None,
-                "completion_time": status.completion_time.isoformat()
-                if status.completion_time
-                else None,
-            }
+            return self._job_status(job_id, jobs.items[0])
 
         except ApiException as e:
             logger.error(
@@ -878,6 +872,89 @@ class KubernetesTrainingManager(TrainingManager):
             )
             return None
 
+    @staticmethod
+    def _job_status(job_id: int, job: client.V1Job) -> Dict[str, Any]:
+        """Build the status dict for a K8s training Job."""
+        status = job.status
+
+        if status.succeeded and status.succeeded > 0:
+            state = "completed"
+        elif status.failed and status.failed > 0:
+            state = "failed"
+        elif status.active and status.active > 0:
+            state = "running"
+        else:
+            state = "pending"
+
+        return {
+            "job_id": job_id,
+            "k8s_job_name": job.metadata.name,
+            "status": state,
+            "active": status.active or 0,
+            "succeeded": status.succeeded or 0,
+            "failed": status.failed or 0,
+            "start_time": status.start_time.isoformat() if status.start_time else None,
+            "completion_time": status.completion_time.isoformat()
+            if status.completion_time
+            else None,
+        }
+
+    def _ensure_status_watch(self) -> None:
+        """Start the status watch thread on first use."""
+        if not self.status_watch_enabled:
+            return
+        if self._status_watch_thread is None or not self._status_watch_thread.is_alive():
+            self._status_watch_thread = threading.Thread(
+                target=self._watch_training_jobs,
+                name="k8s-training-job-watch",
+                daemon=True,
+            )
+            self._status_watch_thread.start()
+
+    def _watch_training_jobs(self) -> None:
+        """Keep the status cache in sync with the namespace's training Jobs.
+
+        A watch started without a resource version first replays every
+        existing Job as ADDED, so the cache is rebuilt from scratch whenever
+        the stream has to be restarted from a fresh list.
+        """
+        resource_version = None
+        while True:
+            try:
+                if resource_version is None:
+                    self._status_cache.clear()
+                stream = watch.Watch().stream(
+                    self.batch_api.list_namespaced_job,
+                    namespace=self.namespace,
+                    label_selector="job-type=training",
+                    resource_version=resource_version,
+                    timeout_seconds=300,
+                )
+                for event in stream:
+                    job = event["object"]
+                    resource_version = job.metadata.resource_version
+                    job_id_label = (job.metadata.labels or {}).get("job-id")
+                    if not job_id_label:
+                        continue
+                    job_id = int(job_id_label)
+                    if event["type"] == "DELETED":
+                        self._status_cache.pop(job_id, None)
+                    else:
+                        self._status_cache[job_id] = self._job_status(job_id, job)
+
+            except ApiException as e:
+                if e.status == 410:
+                    # Resource version too old: start over from a fresh list
+                    resource_version = None
+                    continue
+                logger.warning(f"[KubernetesTrainingManager] Job watch failed: {e}")
+                resource_version = None
+                time.sleep(5)
+            except Exception as e:
+                logger.warning(f"[KubernetesTrainingManager] Job watch error: {e}")
+                resource_version = None
+                time.sleep(5)
+
     def cleanup_resources(self, job_id: int) -> None:
         """Clean up K8s resources for a job."""
         logger.info(f"[KubernetesTrainingManager] Cleaning up resources for job {job_id}")
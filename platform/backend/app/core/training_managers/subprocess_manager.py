@@ -24,6 +24,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+import httpx
 from sqlalchemy.orm import Session
 
 # Optional Loki integration (disabled on Windows due to query issues)
@@ -65,6 +66,12 @@ class SubprocessTrainingManager(TrainingManager):
         self.loki_url = os.getenv('LOKI_URL', 'http://localhost:3100')
         self.loki_enabled = os.getenv('LOKI_ENABLED', 'true').lower() == 'true'
 
+        # Pooled client for Loki pushes: log batches arrive every few seconds
+        # per job, so keep-alive connections are reused instead of reconnecting.
+        # Created lazily in the running event loop (see _get_loki_client).
+        self._loki_client: Optional[httpx.AsyncClient] = None
+        self._loki_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
         if self.loki_enabled:
             logger.info(f"[TrainingSubprocess] Loki logging enabled: {self.loki_url}")
         else:
@@ -445,6 +452,34 @@ class SubprocessTrainingManager(TrainingManager):
         except Exception as e:
             logger.error(f"[TrainingSubprocess] Error in _save_logs_to_db: {e}")
 
+    def _get_loki_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled Loki client for the running event loop.
+
+        An httpx client's connections belong to the loop that opened them and
+        this manager is a process-wide singleton, so the client is created on
+        first use and replaced if called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loki_client is None or self._loki_client_loop is not loop:
+            self._loki_client = httpx.AsyncClient(
+                timeout=5.0,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+            self._loki_client_loop = loop
+        return self._loki_client
+
+    async def close(self) -> None:
+        """
+        Close the pooled Loki client.
+
+        Should be called during application shutdown.
+        """
+        if self._loki_client is not None:
+            await self._loki_client.aclose()
+            self._loki_client = None
+            self._loki_client_loop = None
+
     async def _send_logs_to_loki(self, job_id: int, lines: list[str], log_type: str):
         """
         Send log lines to Loki for real-time log aggregation.
@@ -455,8 +490,6 @@ class SubprocessTrainingManager(TrainingManager):
             log_type: "stdout" or "stderr"
         """
         try:
-            import requests
-
             # Loki Push API endpoint
             url = f"{self.loki_url}/loki/api/v1/push"
 
@@ -487,11 +520,7 @@ class SubprocessTrainingManager(TrainingManager):
             payload = {"streams": [stream]}
 
             # Send to Loki (async)
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: requests.post(url, json=payload, timeout=5)
-            )
+            await self._get_loki_client().post(url, json=payload)
 
         except Exception as e:
             # Don't fail if Loki is down - logs are still saved in DB
@@ -919,3 +948,13 @@ def get_training_subprocess_manager() -> SubprocessTrainingManager:
         _training_subprocess_manager = SubprocessTrainingManager()
 
     return _training_subprocess_manager
+
+
+async def close_training_subprocess_manager() -> None:
+    """
+    Close the global SubprocessTrainingManager's HTTP client, if it was created.
+
+    Should be called during application shutdown.
+    """
+    if _training_subprocess_manager is not None:
+        await _training_subprocess_manager.close()
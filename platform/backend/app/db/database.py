@@ -6,6 +6,7 @@ Phase 11: Microservice Separation - 2-DB Pattern
 """
 
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -24,6 +25,7 @@ def _create_engine(database_url: str):
                 "check_same_thread": False,  # Needed for SQLite
                 "timeout": 30.0,  # 30 second timeout for locks
             },
+            query_cache_size=settings.DB_QUERY_CACHE_SIZE,
         )
 
         # Enable WAL mode for better concurrent access
@@ -36,12 +38,25 @@ def _create_engine(database_url: str):
             cursor.execute("PRAGMA cache_size=-64000")  # 64MB cache
             cursor.close()
     else:
+        # psycopg2: batch executemany UPDATE/DELETE with execute_batch, and send
+        # bulk INSERTs as multi-row VALUES (insertmanyvalues) 1000 rows at a time
+        driver_options = {}
+        if make_url(database_url).get_driver_name() == "psycopg2":
+            driver_options = {
+                "executemany_mode": "values_plus_batch",
+                "executemany_batch_page_size": 500,
+                "insertmanyvalues_page_size": 1000,
+            }
+
         # PostgreSQL/other databases - use connection pooling
         engine = create_engine(
             database_url,
-            pool_size=5,  # Number of connections to maintain
-            max_overflow=10,  # Maximum overflow connections
+            pool_size=settings.DB_POOL_SIZE,  # Number of connections to maintain
+            max_overflow=settings.DB_MAX_OVERFLOW,  # Maximum overflow connections
             pool_pre_ping=True,  # Verify connections before using
+            pool_recycle=settings.DB_POOL_RECYCLE,  # Replace connections before server idle timeouts
+            query_cache_size=settings.DB_QUERY_CACHE_SIZE,  # Compiled SQL cache entries
+            **driver_options,
         )
 
     return engine
@@ -65,7 +80,13 @@ Base = declarative_base()
 
 
 def get_db():
-    """Platform DB session dependency."""
+    """Platform DB session dependency.
+
+    FastAPI caches dependency results per request, so every Depends(get_db)
+    in one request (handler and sub-dependencies alike) shares this session.
+    Request-path helpers should take the session as an argument rather than
+    opening their own with SessionLocal().
+    """
     db = PlatformSessionLocal()
     try:
         yield db
@@ -81,6 +102,9 @@ def get_user_db():
 
     Phase 11: This database is shared between Platform and Labeler.
     Contains: users, organizations, invitations, project_members, etc.
+
+    Shared per request like get_db: get_current_user and the handler use
+    the same session.
     """
     db = UserSessionLocal()
     try:
@@ -2,7 +2,7 @@
 
 import enum
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, JSON, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, JSON, Boolean, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -296,6 +296,11 @@ class Project(Base):
     experiments = relationship("Experiment", back_populates="project", cascade="all, delete-orphan")
     training_jobs = relationship("TrainingJob", back_populates="project", cascade="all, delete-orphan")
 
+    # Per-user project lookups by name
+    __table_args__ = (
+        Index('ix_projects_user_name', 'user_id', 'name'),
+    )
+
 
 class Experiment(Base):
     """Experiment model for organizing training runs.
@@ -407,6 +412,10 @@ class Message(Base):
 
     session = relationship("Session", back_populates="messages")
 
+    __table_args__ = (
+        Index('ix_messages_session_id_id', 'session_id', 'id'),
+    )
+
 
 class TrainingJob(Base):
     """Training job model (also serves as Experiment)."""
@@ -501,6 +510,11 @@ class TrainingJob(Base):
     test_runs = relationship("TestRun", back_populates="training_job", cascade="all, delete-orphan")
     inference_jobs = relationship("InferenceJob", back_populates="training_job", cascade="all, delete-orphan")
 
+    # Project experiment listings (ORDER BY created_at DESC is served by a backward index scan)
+    __table_args__ = (
+        Index('ix_training_jobs_project_created', 'project_id', 'created_at'),
+    )
+
 
 class TrainingMetric(Base):
     """Training metric model."""
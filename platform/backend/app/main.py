@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
 
+import logging
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -17,17 +18,28 @@ else:
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from anyio import to_thread
 from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 
 from app.core.config import settings
+
+# Configure logging once at the entry point (modules only call getLogger)
+logging.basicConfig(
+    level=settings.LOG_LEVEL.upper(),
+    format='[%(asctime)s] %(levelname)s [%(name)s] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
 from app.api import auth, chat, training, projects, debug, datasets, admin, validation, test_inference, models, image_tools, internal, invitations, export, inference, websocket, datasets_images
 # Temporarily disabled: datasets_folder (Phase 11.5 Dataset model cleanup)
 
 # Redis integration (Phase 5)
 from app.services.redis_manager import RedisManager
 from app.services.redis_session_store import RedisSessionStore
+from app.services.response_cache import response_cache
 
 # Global instances for Redis
 redis_manager: RedisManager = None
@@ -36,6 +48,7 @@ session_store: RedisSessionStore = None
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
+    default_response_class=ORJSONResponse,  # orjson renders responses much faster than stdlib json
 )
 
 # Log CORS origins for debugging
@@ -48,6 +61,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Keyset pagination cursor (admin lists)
 )
 
 # Startup event to run migrations and initialize Redis
@@ -56,6 +70,9 @@ async def startup_event():
     """Run startup tasks."""
     global redis_manager, session_store
 
+    # Sync route handlers run on AnyIO worker threads; raise the default limit of 40
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_MAX_WORKERS
+
     # Initialize Redis connection
     print("[STARTUP] Connecting to Redis...")
     try:
@@ -66,6 +83,9 @@ async def startup_event():
         # Initialize Session Store
         session_store = RedisSessionStore(redis_manager)
 
+        # Back the response cache with Redis (falls back to in-process cache otherwise)
+        response_cache.redis = redis_manager
+
         print(f"[STARTUP] Redis connected: {redis_url}")
     except Exception as e:
         print(f"[STARTUP] WARNING: Redis connection failed: {e}")
@@ -172,6 +192,13 @@ async def shutdown_event():
     except Exception as e:
         print(f"[SHUTDOWN] Error closing Temporal client: {e}")
 
+    # Close the training manager's Loki client
+    try:
+        from app.core.training_managers.subprocess_manager import close_training_subprocess_manager
+        await close_training_subprocess_manager()
+    except Exception as e:
+        print(f"[SHUTDOWN] Error closing Loki client: {e}")
+
     # Close Redis if initialized
     if redis_manager:
         print("[SHUTDOWN] Closing Redis connection...")
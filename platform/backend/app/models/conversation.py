@@ -7,12 +7,13 @@ This module defines:
 - Pydantic schemas for validation
 """
 
-from enum import Enum
-from typing import Optional, List, Dict, Any
+from enum import StrEnum
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field
 
 
-class ConversationState(str, Enum):
+class ConversationState(StrEnum):
     """
     대화 상태 정의
 
@@ -67,7 +68,7 @@ class ConversationState(str, Enum):
     """대기 중 - 다음 작업 대기"""
 
 
-class ActionType(str, Enum):
+class ActionType(StrEnum):
     """
     LLM이 반환할 수 있는 액션 타입
 
@@ -169,11 +170,17 @@ class ActionBase(BaseModel):
     action: ActionType
     message: str = Field(..., description="사용자에게 보여줄 메시지")
 
+    class Config:
+        # Immutable once parsed; unknown keys from the LLM are dropped
+        extra = "ignore"
+        frozen = True
+        use_enum_values = True
+
 
 class AskClarificationAction(ActionBase):
     """추가 정보 요청 액션"""
     action: ActionType = ActionType.ASK_CLARIFICATION
-    missing_fields: List[str] = Field(default_factory=list, description="부족한 필드 목록")
+    missing_fields: Tuple[str, ...] = Field((), description="부족한 필드 목록")
     current_config: Dict[str, Any] = Field(default_factory=dict, description="현재까지 수집된 설정")
 
 
@@ -245,40 +252,44 @@ class TrainingConfig(BaseModel):
 
     class Config:
         protected_namespaces = ()  # Allow model_name field
+        extra = "ignore"
+        frozen = True
+
+    # 필수 필드 (is_complete / get_missing_fields) - built once, fetched in one attrgetter call
+    REQUIRED_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "framework",
+        "model_name",
+        "task_type",
+        "dataset_path",
+        "epochs",
+        "batch_size",
+        "learning_rate",
+    )
+    _get_required: ClassVar[Callable[[Any], Tuple[Any, ...]]] = attrgetter(*REQUIRED_FIELDS)
 
     def is_complete(self) -> bool:
         """모든 필수 필드가 채워졌는지 확인"""
-        required_fields = [
-            "framework",
-            "model_name",
-            "task_type",
-            "dataset_path",
-            "epochs",
-            "batch_size",
-            "learning_rate",
-        ]
-        return all(getattr(self, field) is not None for field in required_fields)
+        return None not in self._get_required(self)
 
     def get_missing_fields(self) -> List[str]:
         """부족한 필드 목록 반환"""
-        required_fields = [
-            "framework",
-            "model_name",
-            "task_type",
-            "dataset_path",
-            "epochs",
-            "batch_size",
-            "learning_rate",
+        return [
+            field
+            for field, value in zip(self.REQUIRED_FIELDS, self._get_required(self))
+            if value is None
         ]
-        return [field for field in required_fields if getattr(self, field) is None]
 
 
 class ExperimentMetadata(BaseModel):
     """실험 메타데이터 스키마"""
     name: Optional[str] = Field(None, description="실험 이름")
-    tags: List[str] = Field(default_factory=list, description="태그")
+    tags: Tuple[str, ...] = Field((), description="태그")
     notes: Optional[str] = Field(None, description="노트")
 
+    class Config:
+        extra = "ignore"
+        frozen = True
+
 
 # ========== Gemini Response Schema (for structured output) ==========
 
@@ -308,3 +319,4 @@ class GeminiActionResponse(BaseModel):
 
     class Config:
         use_enum_values = True  # Enum을 문자열로 직렬화
+        frozen = True  # Handlers only read the parsed response
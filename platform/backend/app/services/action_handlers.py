@@ -5,7 +5,10 @@ Each action type has a corresponding handler that executes the actual logic.
 """
 
 import logging
+import os
+import re
 from typing import Dict, Any, Optional
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models.conversation import (
@@ -19,9 +22,19 @@ from app.db.models import (
     Project,
     TrainingJob,
 )
+from app.services.response_cache import invalidate_admin_lists, invalidate_project_lists
+from app.utils.tool_registry import tool_registry
 
 logger = logging.getLogger(__name__)
 
+# Fallback config extraction patterns (_extract_from_user_message)
+# Dataset path: C:\path\to\dataset or /path/to/dataset
+_PATH_RE = re.compile(r'[A-Za-z]:\\[\w\\\-\.]+|/[\w/\-\.]+')
+_EPOCH_RE = re.compile(r'(\d+)\s*(?:epoch|에포크)')  # 숫자 + "epoch" or "에포크"
+_BATCH_RE = re.compile(r'(?:batch|배치)[\s:]*(\d+)')  # "batch" or "배치" + 숫자
+_LR_RE = re.compile(r'(?:lr|learning.?rate|학습률)[\s:=]*(0?\.\d+)')
+_DEFAULT_KEYWORDS = ("기본", "default", "기본값")
+
 
 class ActionHandlers:
     """
@@ -33,6 +46,54 @@ class ActionHandlers:
     - temp_data: Updated temporary data
     """
 
+    # Id of the shared "Uncategorized" project, cached after the first lookup
+    # (re-checked with a primary-key get, since an admin can delete it)
+    _uncategorized_id: Optional[int] = None
+
+    # ActionType -> handler method name (resolved with getattr per call)
+    _HANDLER_TABLE: Dict[ActionType, str] = {
+        # 기존 핸들러
+        ActionType.ASK_CLARIFICATION: "_handle_ask_clarification",
+        ActionType.SHOW_PROJECT_OPTIONS: "_handle_show_project_options",
+        ActionType.SHOW_PROJECT_LIST: "_handle_show_project_list",
+        ActionType.CREATE_PROJECT: "_handle_create_project",
+        ActionType.SELECT_PROJECT: "_handle_select_project",
+        ActionType.SKIP_PROJECT: "_handle_skip_project",
+        ActionType.CONFIRM_TRAINING: "_handle_confirm_training",
+        ActionType.START_TRAINING: "_handle_start_training",
+        ActionType.ERROR: "_handle_error",
+
+        # Phase 1 추가 핸들러 - Dataset
+        ActionType.ANALYZE_DATASET: "_handle_analyze_dataset",
+        ActionType.SHOW_DATASET_ANALYSIS: "_handle_show_dataset_analysis",
+        ActionType.LIST_DATASETS: "_handle_list_datasets",
+
+        # Phase 1 추가 핸들러 - Model
+        ActionType.SEARCH_MODELS: "_handle_search_models",
+        ActionType.SHOW_MODEL_INFO: "_handle_show_model_info",
+        ActionType.RECOMMEND_MODELS: "_handle_recommend_models",
+        ActionType.COMPARE_MODELS: "_handle_compare_models",
+
+        # Phase 1 추가 핸들러 - Training Control
+        ActionType.SHOW_TRAINING_STATUS: "_handle_show_training_status",
+        ActionType.STOP_TRAINING: "_handle_stop_training",
+        ActionType.LIST_TRAINING_JOBS: "_handle_list_training_jobs",
+        ActionType.RESUME_TRAINING: "_handle_resume_training",
+
+        # Phase 1 추가 핸들러 - Inference
+        ActionType.START_QUICK_INFERENCE: "_handle_start_quick_inference",
+        ActionType.START_BATCH_INFERENCE: "_handle_start_batch_inference",
+        ActionType.SHOW_INFERENCE_RESULTS: "_handle_show_inference_results",
+
+        # Phase 1 추가 핸들러 - Results
+        ActionType.SHOW_VALIDATION_RESULTS: "_handle_show_validation_results",
+        ActionType.SHOW_CONFUSION_MATRIX: "_handle_show_confusion_matrix",
+
+        # Phase 1 추가 핸들러 - Utility
+        ActionType.SHOW_HELP: "_handle_show_help",
+        ActionType.RESET_CONVERSATION: "_handle_reset_conversation",
+    }
+
     def __init__(self, db: Session):
         self.db = db
         self.current_user_id = None  # Will be set during handle_action
@@ -69,97 +130,26 @@ class ActionHandlers:
         temp_data = session.temp_data or {}
         existing_config = temp_data.get("config", {})
 
-        # TRACE: Step 4 - Before merging
-        print(f"\n[TRACE-4-MERGE] Action handler:")
-        print(f"  existing_config (from session): {existing_config}")
-        print(f"  action_response.current_config: {action_response.current_config}")
+        logger.debug("[MERGE] existing=%s incoming=%s", existing_config, action_response.current_config)
 
         # Merge LLM's config first
         if action_response.current_config:
             existing_config.update(action_response.current_config)
-            print(f"  MERGED config: {existing_config}")
-        else:
-            print(f"  NO MERGE - action_response.current_config is None/empty")
 
         # Then apply fallback extraction from user message
-        # CRITICAL DEBUG: Write to file
-        try:
-            import os
-            import datetime
-            log_path = "C:\\Users\\flyto\\Project\\Github\\mvp-vision-ai-platform\\mvp\\data\\logs\\fallback_debug.log"
-            os.makedirs(os.path.dirname(log_path), exist_ok=True)
-
-            with open(log_path, "a", encoding="utf-8") as f:
-                timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                f.write(f"\n[{timestamp}] Action: {action_response.action}\n")
-                f.write(f"Before: {existing_config}\n")
-                f.write(f"User message: {user_message}\n")
-        except Exception as e:
-            print(f"LOG ERROR: {e}")
-
+        logger.debug("[FALLBACK] action=%s before=%s msg=%r", action_response.action, existing_config, user_message)
         existing_config = self._extract_from_user_message(user_message, existing_config)
 
-        try:
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(f"After: {existing_config}\n")
-        except:
-            pass
-
-        logger.warning(f"[DEBUG] Before extraction: {existing_config}")
-        logger.warning(f"[DEBUG] After extraction: {existing_config}")
-
         # Update session temp_data with extracted config
         temp_data["config"] = existing_config
         session.temp_data = temp_data
 
-        logger.warning(f"[FALLBACK] Config after extraction: {existing_config}")
+        logger.info("[FALLBACK] Config after extraction: %s", existing_config)
 
         action = action_response.action
 
-        handlers = {
-            # 기존 핸들러
-            ActionType.ASK_CLARIFICATION: self._handle_ask_clarification,
-            ActionType.SHOW_PROJECT_OPTIONS: self._handle_show_project_options,
-            ActionType.SHOW_PROJECT_LIST: self._handle_show_project_list,
-            ActionType.CREATE_PROJECT: self._handle_create_project,
-            ActionType.SELECT_PROJECT: self._handle_select_project,
-            ActionType.SKIP_PROJECT: self._handle_skip_project,
-            ActionType.CONFIRM_TRAINING: self._handle_confirm_training,
-            ActionType.START_TRAINING: self._handle_start_training,
-            ActionType.ERROR: self._handle_error,
-
-            # Phase 1 추가 핸들러 - Dataset
-            ActionType.ANALYZE_DATASET: self._handle_analyze_dataset,
-            ActionType.SHOW_DATASET_ANALYSIS: self._handle_show_dataset_analysis,
-            ActionType.LIST_DATASETS: self._handle_list_datasets,
-
-            # Phase 1 추가 핸들러 - Model
-            ActionType.SEARCH_MODELS: self._handle_search_models,
-            ActionType.SHOW_MODEL_INFO: self._handle_show_model_info,
-            ActionType.RECOMMEND_MODELS: self._handle_recommend_models,
-            ActionType.COMPARE_MODELS: self._handle_compare_models,
-
-            # Phase 1 추가 핸들러 - Training Control
-            ActionType.SHOW_TRAINING_STATUS: self._handle_show_training_status,
-            ActionType.STOP_TRAINING: self._handle_stop_training,
-            ActionType.LIST_TRAINING_JOBS: self._handle_list_training_jobs,
-            ActionType.RESUME_TRAINING: self._handle_resume_training,
-
-            # Phase 1 추가 핸들러 - Inference
-            ActionType.START_QUICK_INFERENCE: self._handle_start_quick_inference,
-            ActionType.START_BATCH_INFERENCE: self._handle_start_batch_inference,
-            ActionType.SHOW_INFERENCE_RESULTS: self._handle_show_inference_results,
-
-            # Phase 1 추가 핸들러 - Results
-            ActionType.SHOW_VALIDATION_RESULTS: self._handle_show_validation_results,
-            ActionType.SHOW_CONFUSION_MATRIX: self._handle_show_confusion_matrix,
-
-            # Phase 1 추가 핸들러 - Utility
-            ActionType.SHOW_HELP: self._handle_show_help,
-            ActionType.RESET_CONVERSATION: self._handle_reset_conversation,
-        }
-
-        handler = handlers.get(action)
+        handler_name = self._HANDLER_TABLE.get(action)
+        handler = getattr(self, handler_name) if handler_name else None
         if not handler:
             logger.error(f"Unknown action: {action}")
             return self._handle_error(action_response, session, user_message)
@@ -196,7 +186,6 @@ class ActionHandlers:
     ) -> Dict[str, Any]:
         """Handle ask_clarification action"""
         temp_data = session.temp_data or {}
-        current_state = ConversationState(session.state)
 
         # Config is already extracted in handle_action, just retrieve it
         existing_config = temp_data.get("config", {})
@@ -259,7 +248,9 @@ class ActionHandlers:
     ) -> Dict[str, Any]:
         """Handle show_project_list action"""
         # Fetch projects (excluding Uncategorized)
-        projects = self.db.query(Project).filter(
+        projects = self.db.query(
+            Project.id, Project.name, Project.description, Project.task_type
+        ).filter(
             Project.name != "Uncategorized"
         ).order_by(Project.updated_at.desc()).all()
 
@@ -277,27 +268,31 @@ class ActionHandlers:
                 "temp_data": temp_data,
             }
 
-        # Build project list
-        message = "다음 프로젝트 중 하나를 선택해주세요:\n\n"
+        # Count experiments for all projects in one query
+        exp_counts = dict(
+            self.db.query(TrainingJob.project_id, func.count(TrainingJob.id))
+            .group_by(TrainingJob.project_id)
+            .all()
+        )
+
+        # Build project list (fragments joined once at the end)
+        parts = ["다음 프로젝트 중 하나를 선택해주세요:\n\n"]
         available_projects = []
 
         for idx, project in enumerate(projects, start=1):
             desc = f" - {project.description}" if project.description else ""
             task = f" ({project.task_type})" if project.task_type else ""
+            exp_count = exp_counts.get(project.id, 0)
 
-            # Count experiments
-            exp_count = self.db.query(TrainingJob).filter(
-                TrainingJob.project_id == project.id
-            ).count()
-
-            message += f"{idx}. **{project.name}**{task}{desc} (실험 {exp_count}개)\n"
+            parts.append(f"{idx}. **{project.name}**{task}{desc} (실험 {exp_count}개)\n")
 
             available_projects.append({
                 "id": project.id,
                 "name": project.name,
             })
 
-        message += "\n프로젝트 번호를 입력하거나 프로젝트 이름을 입력해주세요."
+        parts.append("\n프로젝트 번호를 입력하거나 프로젝트 이름을 입력해주세요.")
+        message = "".join(parts)
 
         # Save available projects to temp_data
         temp_data["available_projects"] = available_projects
@@ -355,6 +350,9 @@ class ActionHandlers:
                 "temp_data": temp_data
             }
 
+        await invalidate_admin_lists()
+        await invalidate_project_lists()
+
         # Save project ID to temp_data
         temp_data["selected_project_id"] = new_project.id
 
@@ -381,7 +379,7 @@ class ActionHandlers:
 
         project_identifier = action_response.project_identifier
 
-        # Try to find project
+        # Try to find project (id/name only; the reply needs nothing else)
         project = None
 
         # Check if identifier is a number (project index)
@@ -391,11 +389,16 @@ class ActionHandlers:
 
             if 0 <= project_idx < len(available_projects):
                 project_id = available_projects[project_idx]["id"]
-                project = self.db.query(Project).filter(Project.id == project_id).first()
+                project = self.db.query(Project.id, Project.name).filter(
+                    Project.id == project_id
+                ).first()
 
-        # If not found, try to search by name
+        # If not found, try to search by name: exact match first (unique
+        # index), then substring (pg_trgm index on PostgreSQL)
         if not project:
-            project = self.db.query(Project).filter(
+            project = self.db.query(Project.id, Project.name).filter(
+                Project.name == project_identifier
+            ).first() or self.db.query(Project.id, Project.name).filter(
                 Project.name.ilike(f"%{project_identifier}%")
             ).first()
 
@@ -431,21 +434,7 @@ class ActionHandlers:
         temp_data = session.temp_data or {}
         config = temp_data.get("config", {})
 
-        # Get or create Uncategorized project
-        uncategorized = self.db.query(Project).filter(
-            Project.name == "Uncategorized"
-        ).first()
-
-        if not uncategorized:
-            uncategorized = Project(
-                name="Uncategorized",
-                description="프로젝트 없이 진행한 실험들",
-            )
-            self.db.add(uncategorized)
-            self.db.commit()
-            self.db.refresh(uncategorized)
-
-        temp_data["selected_project_id"] = uncategorized.id
+        temp_data["selected_project_id"] = await self._get_uncategorized_project_id()
 
         # Build confirmation message
         message = "프로젝트 없이 진행합니다.\n\n"
@@ -458,6 +447,30 @@ class ActionHandlers:
             "temp_data": temp_data,
         }
 
+    async def _get_uncategorized_project_id(self) -> int:
+        """Get (or create) the Uncategorized project id, cached per process"""
+        cached_id = ActionHandlers._uncategorized_id
+        if cached_id is not None and self.db.get(Project, cached_id) is not None:
+            return cached_id
+
+        project_id = self.db.query(Project.id).filter(
+            Project.name == "Uncategorized"
+        ).scalar()
+
+        if project_id is None:
+            uncategorized = Project(
+                name="Uncategorized",
+                description="프로젝트 없이 진행한 실험들",
+            )
+            self.db.add(uncategorized)
+            self.db.commit()
+            project_id = uncategorized.id
+            await invalidate_admin_lists()
+            await invalidate_project_lists()
+
+        ActionHandlers._uncategorized_id = project_id
+        return project_id
+
     async def _handle_confirm_training(
         self,
         action_response: GeminiActionResponse,
@@ -531,6 +544,9 @@ class ActionHandlers:
         self.db.add(training_job)
         self.db.commit()
         self.db.refresh(training_job)
+        # The project's experiment_count changed
+        await invalidate_admin_lists()
+        await invalidate_project_lists()
 
         logger.info(f"Created training job: ID={training_job.id}, dataset_id={dataset_id}, dataset_path={dataset_path}")
 
@@ -568,15 +584,20 @@ class ActionHandlers:
 
         This handles cases where LLM doesn't properly extract structured data.
         """
-        import re
-        import os
-
         msg_lower = user_message.lower().strip()
 
+        # Every pattern below needs a digit, a path separator or a default
+        # keyword; short replies like "예" / "아니오" skip the regexes entirely
+        if (
+            "/" not in user_message
+            and "\\" not in user_message
+            and not any(c.isdigit() for c in user_message)
+            and not any(keyword in msg_lower for keyword in _DEFAULT_KEYWORDS)
+        ):
+            return existing_config
+
         # Extract dataset path (Windows/Unix paths)
-        # Match patterns like: C:\path\to\dataset or /path/to/dataset
-        path_pattern = r'[A-Za-z]:\\[\w\\\-\.]+|/[\w/\-\.]+'
-        path_matches = re.findall(path_pattern, user_message)
+        path_matches = _PATH_RE.findall(user_message)
         if path_matches:
             # Take the longest match (most likely to be the full path)
             dataset_path = max(path_matches, key=len)
@@ -585,7 +606,7 @@ class ActionHandlers:
                 logger.info(f"Extracted dataset_path from user message: {dataset_path}")
 
         # Extract default values (Korean & English)
-        if any(keyword in msg_lower for keyword in ["기본", "default", "기본값"]):
+        if any(keyword in msg_lower for keyword in _DEFAULT_KEYWORDS):
             if "epochs" not in existing_config or existing_config.get("epochs") is None:
                 existing_config["epochs"] = 50
                 logger.info("Applied default epochs: 50")
@@ -599,19 +620,19 @@ class ActionHandlers:
                 existing_config["dataset_format"] = "imagefolder"
 
         # Extract epochs (숫자 + "epoch" or "에포크")
-        epoch_match = re.search(r'(\d+)\s*(?:epoch|에포크)', msg_lower)
+        epoch_match = _EPOCH_RE.search(msg_lower)
         if epoch_match:
             existing_config["epochs"] = int(epoch_match.group(1))
             logger.info(f"Extracted epochs: {existing_config['epochs']}")
 
         # Extract batch size (숫자 + "batch" or "배치")
-        batch_match = re.search(r'(?:batch|배치)[\s:]*(\d+)', msg_lower)
+        batch_match = _BATCH_RE.search(msg_lower)
         if batch_match:
             existing_config["batch_size"] = int(batch_match.group(1))
             logger.info(f"Extracted batch_size: {existing_config['batch_size']}")
 
         # Extract learning rate
-        lr_match = re.search(r'(?:lr|learning.?rate|학습률)[\s:=]*(0?\.\d+)', msg_lower)
+        lr_match = _LR_RE.search(msg_lower)
         if lr_match:
             existing_config["learning_rate"] = float(lr_match.group(1))
             logger.info(f"Extracted learning_rate: {existing_config['learning_rate']}")
@@ -658,8 +679,6 @@ class ActionHandlers:
 
         Analyzes a dataset's structure, format, and quality using Tool Registry.
         """
-        from app.utils.tool_registry import tool_registry
-
         temp_data = session.temp_data or {}
         config = temp_data.get("config", {})
 
@@ -747,8 +766,6 @@ class ActionHandlers:
 
         Lists available datasets in default or specified directory.
         """
-        from app.utils.tool_registry import tool_registry
-
         temp_data = session.temp_data or {}
 
         # Get base path from action response or use default
@@ -857,8 +874,6 @@ class ActionHandlers:
 
         Searches for models based on task type, framework, or tags.
         """
-        from app.utils.tool_registry import tool_registry
-
         temp_data = session.temp_data or {}
         config = temp_data.get("config", {})
 
@@ -920,8 +935,6 @@ class ActionHandlers:
 
         Shows detailed information about a specific model.
         """
-        from app.utils.tool_registry import tool_registry
-
         temp_data = session.temp_data or {}
         config = temp_data.get("config", {})
 
@@ -975,8 +988,6 @@ class ActionHandlers:
 
         Recommends models based on dataset analysis and task type.
         """
-        from app.utils.tool_registry import tool_registry
-
         temp_data = session.temp_data or {}
         config = temp_data.get("config", {})
         dataset_analysis = temp_data.get("dataset_analysis", {})
@@ -1125,15 +1136,12 @@ class ActionHandlers:
 
         Shows current status and progress of a training job.
         """
-        from app.utils.tool_registry import tool_registry
-
         temp_data = session.temp_data or {}
 
         # Try to get job_id from session's most recent training job
         job_id = None
 
         # Check if user specified a job_id in the message
-        import re
         job_match = re.search(r'(?:job|작업)[\s#]*(\d+)', user_message.lower())
         if job_match:
             job_id = int(job_match.group(1))
@@ -1191,12 +1199,9 @@ class ActionHandlers:
 
         Stops a running training job.
         """
-        from app.utils.tool_registry import tool_registry
-
         temp_data = session.temp_data or {}
 
         # Try to get job_id from user message
-        import re
         job_id = None
         job_match = re.search(r'(?:job|작업)[\s#]*(\d+)', user_message.lower())
         if job_match:
@@ -1258,8 +1263,6 @@ class ActionHandlers:
 
         Lists training jobs with optional filters.
         """
-        from app.utils.tool_registry import tool_registry
-
         temp_data = session.temp_data or {}
         config = temp_data.get("config", {})
 
@@ -1331,12 +1334,9 @@ class ActionHandlers:
 
         Runs quick inference on a single image.
         """
-        from app.utils.tool_registry import tool_registry
-
         temp_data = session.temp_data or {}
 
         # Try to extract job_id and image_path from message
-        import re
         job_id = None
         image_path = None
 
@@ -1477,8 +1477,6 @@ class ActionHandlers:
             }
 
         try:
-            from app.utils.tool_registry import tool_registry
-
             # Call compare_models tool
             result = await tool_registry.call_tool(
                 "compare_models",
@@ -10,17 +10,73 @@ Orchestrates conversation flow:
 """
 
 import logging
-import json
-from typing import Dict, Any, Optional
+import re
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Deque, Dict, Any, Optional, Tuple
+from sqlalchemy import bindparam, select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
 
 from app.db.models import Session as SessionModel, Message as MessageModel
 from app.models.conversation import ConversationState, GeminiActionResponse, ActionType
-from app.utils.llm_structured import structured_intent_parser
+from app.utils.llm_structured import get_structured_intent_parser
 from app.services.action_handlers import ActionHandlers
 
 logger = logging.getLogger(__name__)
 
+# Session lookup by id; built once so its compiled SQL is always served
+# from the engine's query cache.
+_SESSION_BY_ID = select(SessionModel).where(SessionModel.id == bindparam("session_id"))
+
+# Replies the CONFIRMING prompt maps to start_training
+_CONFIRM_REPLIES = frozenset({"예", "yes", "y", "네", "확인", "ok"})
+
+# SELECTING_PROJECT menu replies -> option (1: new, 2: existing, 3: skip)
+_PROJECT_OPTION_REPLIES = {
+    "1": 1, "1번": 1, "신규": 1,
+    "2": 2, "2번": 2, "기존": 2,
+    "3": 3, "3번": 3, "건너뛰기": 3, "없이": 3,
+}
+
+# Numbered pick from the project list ("2", "2번", "2 번")
+_PROJECT_NUMBER_RE = re.compile(r"(\d+)\s*번?")
+
+# Recent formatted context lines per session id, LRU-bounded. Each entry is
+# tagged with the Session.updated_at that process_message stamped when it
+# stored it; any other write to the session (or a turn served by another
+# worker) changes updated_at, so the entry misses and is rebuilt from the DB.
+# Entries are validated on every read and the LRU bound caps memory, so no
+# TTL is needed.
+CONTEXT_CACHE_MAXSIZE = 1024
+_context_cache: "OrderedDict[int, Tuple[datetime, Deque[str]]]" = OrderedDict()
+
+
+# Character budget for the history sent to the LLM (~2000 tokens at ~4
+# chars/token). Long assistant replies (project/model lists) would otherwise
+# let a 10-message window grow without bound.
+CONTEXT_MAX_CHARS = 8000
+
+
+def _format_context_line(role: str, content: str) -> str:
+    return f"{'User' if role == 'user' else 'Assistant'}: {content}"
+
+
+def _join_context(lines: Deque[str], max_chars: int = CONTEXT_MAX_CHARS) -> str:
+    """Join the newest context lines that fit in max_chars (oldest dropped first)"""
+    kept = []
+    remaining = max_chars
+    for line in reversed(lines):
+        if len(line) > remaining:
+            if not kept:
+                # Even the latest line is over budget: keep its tail
+                kept.append(line[-remaining:])
+            break
+        kept.append(line)
+        remaining -= len(line) + 1
+    return "\n".join(reversed(kept))
+
 
 class ConversationManager:
     """
@@ -35,6 +91,7 @@ class ConversationManager:
     def __init__(self, db: Session):
         self.db = db
         self.action_handlers = ActionHandlers(db)
+        self.intent_parser = get_structured_intent_parser()
 
     async def process_message(
         self,
@@ -56,33 +113,28 @@ class ConversationManager:
                 "state": str,                # New conversation state
                 "training_job_id": int       # Optional, if training started
             }
+
+        Raises:
+            ValueError: If the session does not exist (nothing to attach an error reply to)
         """
-        try:
-            # 1. Load session
-            session = self.db.query(SessionModel).filter(
-                SessionModel.id == session_id
-            ).first()
+        # 1. Load session
+        # Identity-map fast path: no SELECT if the chat endpoint already
+        # loaded this session in the same DB session
+        session = self.db.get(SessionModel, session_id)
 
-            if not session:
-                raise ValueError(f"Session {session_id} not found")
+        if not session:
+            raise ValueError(f"Session {session_id} not found")
 
+        try:
             current_state = ConversationState(session.state)
             temp_data = session.temp_data or {}
 
-            # TRACE: Step 1 - Load from DB
-            import sys
-            sys.stderr.write(f"\n[TRACE-1-LOAD] Session {session_id}\n")
-            sys.stderr.write(f"  State: {current_state}\n")
-            sys.stderr.write(f"  temp_data from DB: {str(temp_data)}\n")
-            if "config" in temp_data:
-                sys.stderr.write(f"  config keys: {list(temp_data['config'].keys())}\n")
-            sys.stderr.flush()
-
-            logger.info(f"[Session {session_id}] Current state: {current_state}")
-            logger.debug(f"[Session {session_id}] Temp data: {json.dumps(temp_data, ensure_ascii=False)}")
+            logger.info("[Session %s] Current state: %s", session_id, current_state)
+            logger.debug("[Session %s] Temp data: %s", session_id, temp_data)
 
-            # 2. Build conversation context (last 5 messages)
-            context = self._build_context(session)
+            # 2. Build conversation context (last 10 messages)
+            context_lines = self._get_context_lines(session)
+            context = _join_context(context_lines)
 
             # 2.5. Handle dataset listing keywords (LLM sometimes fails to route to list_datasets)
             dataset_keywords = ['기본 데이터셋', '기본으로 제공', '사용 가능한 데이터셋', '어떤 데이터셋', 'built-in dataset', '제공되는 데이터셋']
@@ -102,70 +154,54 @@ class ConversationManager:
                     action_response = direct_action
                 else:
                     # Fall back to LLM for complex inputs
-                    action_response = await structured_intent_parser.parse_intent(
+                    action_response = await self.intent_parser.parse_intent(
                         user_message=user_message,
                         state=current_state,
                         context=context,
                         temp_data=temp_data
                     )
+            # Plain "yes" in CONFIRMING always means start_training: skip the LLM round-trip
+            elif current_state == ConversationState.CONFIRMING and self._is_confirmation(user_message):
+                logger.info(f"[Session {session_id}] Direct action (bypassing LLM): {ActionType.START_TRAINING}")
+                action_response = GeminiActionResponse(
+                    action=ActionType.START_TRAINING,
+                    message="학습을 시작합니다..."
+                )
             else:
                 # 3. Parse intent with LLM (get structured action)
                 logger.info(f"[Session {session_id}] Parsing intent: '{user_message[:100]}...'")
 
-                action_response: GeminiActionResponse = await structured_intent_parser.parse_intent(
+                action_response: GeminiActionResponse = await self.intent_parser.parse_intent(
                     user_message=user_message,
                     state=current_state,
                     context=context,
                     temp_data=temp_data
                 )
 
-            logger.info(f"[Session {session_id}] LLM action: {action_response.action}")
-            logger.debug(f"[Session {session_id}] LLM message: {action_response.message}")
-
-            # EXPLICIT DEBUG - Log LLM response to file (optional, only in dev)
-            try:
-                from pathlib import Path
-                debug_log_path = Path(__file__).parent.parent.parent / "llm_debug.log"
-                with open(debug_log_path, "a", encoding="utf-8") as f:
-                    f.write("\n" + "="*80 + "\n")
-                    f.write(f"[DEBUG] LLM Response for session {session_id}:\n")
-                    f.write(f"Action: {action_response.action}\n")
-                    f.write(f"Message: {action_response.message[:200]}\n")
-                    if action_response.current_config:
-                        f.write(f"Current Config: {json.dumps(action_response.current_config, ensure_ascii=False)}\n")
-                    else:
-                        f.write(f"Current Config: NONE/NULL\n")
-                    if action_response.config:
-                        f.write(f"Config: {json.dumps(action_response.config, ensure_ascii=False)}\n")
-                    f.write("="*80 + "\n")
-            except Exception as e:
-                # Ignore debug log errors in production
-                logger.debug(f"[Session {session_id}] Debug log failed (ignored): {e}")
+            logger.info("[Session %s] LLM action: %s", session_id, action_response.action)
+            logger.debug(
+                "[Session %s] LLM message: %s current_config=%s config=%s",
+                session_id, action_response.message,
+                action_response.current_config, action_response.config
+            )
 
             # 4. Execute action
-            logger.warning(f"[CM] Calling handle_action for action: {action_response.action}")
-            logger.warning(f"[CM] User message: {user_message}")
+            logger.debug("[Session %s] Calling handle_action for %s (user message: %r)",
+                         session_id, action_response.action, user_message)
             result = await self.action_handlers.handle_action(
                 action_response=action_response,
                 session=session,
                 user_message=user_message,
                 user_id=user_id  # Pass user ID for ownership
             )
-            logger.warning(f"[CM] handle_action returned")
 
             new_state = result["new_state"]
             response_message = result["message"]
             updated_temp_data = result["temp_data"]
             training_job_id = result.get("training_job_id")
 
-            logger.info(f"[Session {session_id}] State transition: {current_state} -> {new_state}")
-
-            # TRACE: Step 5 - Before saving to DB
-            print(f"\n[TRACE-5-SAVE] Saving to DB:")
-            print(f"  new_state: {new_state}")
-            print(f"  updated_temp_data: {json.dumps(updated_temp_data, ensure_ascii=False)}")
-            if "config" in updated_temp_data:
-                print(f"  config keys: {list(updated_temp_data['config'].keys())}")
+            logger.info("[Session %s] State transition: %s -> %s", session_id, current_state, new_state)
+            logger.debug("[Session %s] Saving temp_data: %s", session_id, updated_temp_data)
 
             # 5. Update session in DB
             session.state = new_state.value
@@ -173,38 +209,33 @@ class ConversationManager:
 
             # CRITICAL FIX: Force SQLAlchemy to detect JSON column change
             # When updated_temp_data is the same dict object, SQLAlchemy won't see the change
-            from sqlalchemy.orm.attributes import flag_modified
             flag_modified(session, "temp_data")
 
-            # 6. Save messages
-            # Save user message
+            # 6. Save messages (user + assistant flushed as one batched INSERT)
             user_msg = MessageModel(
                 session_id=session.id,
                 role="user",
                 content=user_message
             )
-            self.db.add(user_msg)
-
-            # Save assistant message
             assistant_msg = MessageModel(
                 session_id=session.id,
                 role="assistant",
                 content=response_message
             )
-            self.db.add(assistant_msg)
+            self.db.add_all([user_msg, assistant_msg])
+
+            # Stamp updated_at ourselves so the cached context can be tagged with it
+            updated_at = datetime.utcnow()
+            session.updated_at = updated_at
 
             # 7. Commit all changes
             self.db.commit()
 
-            # TRACE: Step 6 - After commit, verify what's in DB
-            self.db.refresh(session)
-            print(f"\n[TRACE-6-VERIFY] After commit:")
-            print(f"  session.state: {session.state}")
-            print(f"  session.temp_data: {session.temp_data}")
-            if session.temp_data and "config" in session.temp_data:
-                print(f"  config keys in DB: {list(session.temp_data['config'].keys())}")
-            else:
-                print(f"  NO CONFIG IN DB!")
+            context_lines.extend((
+                _format_context_line("user", user_message),
+                _format_context_line("assistant", response_message),
+            ))
+            self._remember_context(session_id, updated_at, context_lines)
 
             logger.info(f"[Session {session_id}] Response sent, state updated to {new_state}")
 
@@ -242,6 +273,12 @@ class ConversationManager:
 
         except Exception as e:
             logger.error(f"[Session {session_id}] Error processing message: {e}", exc_info=True)
+            _context_cache.pop(session_id, None)
+
+            # A DB error leaves the transaction unusable: roll it back so the
+            # error reply goes out in a fresh one instead of failing again
+            if isinstance(e, SQLAlchemyError):
+                self.db.rollback()
 
             # Save error message
             try:
@@ -252,14 +289,20 @@ class ConversationManager:
                 )
                 self.db.add(error_msg)
                 self.db.commit()
-            except Exception as db_error:
-                logger.error(f"Failed to save error message: {db_error}")
+            except SQLAlchemyError as db_error:
+                self.db.rollback()
+                logger.error(f"Failed to save error message: {db_error}", exc_info=True)
 
             return {
                 "message": f"죄송합니다. 오류가 발생했습니다: {str(e)}",
                 "state": ConversationState.ERROR.value
             }
 
+    @staticmethod
+    def _is_confirmation(user_message: str) -> bool:
+        """Whether a CONFIRMING-state reply is an unambiguous "yes" (same list as the LLM prompt)"""
+        return user_message.strip().lower() in _CONFIRM_REPLIES
+
     def _handle_project_selection(self, user_message: str, temp_data: Dict[str, Any]) -> Optional[GeminiActionResponse]:
         """
         Handle simple project selection inputs (1, 2, 3) directly
@@ -272,8 +315,9 @@ class ConversationManager:
         if "available_projects" in temp_data:
             # User is selecting a specific project from the list by number
             # Handle numeric selection directly
-            if msg.replace("번", "").isdigit():
-                project_number = msg.replace("번", "")
+            match = _PROJECT_NUMBER_RE.fullmatch(msg)
+            if match:
+                project_number = match.group(1)
                 return GeminiActionResponse(
                     action=ActionType.SELECT_PROJECT,
                     message=f"프로젝트 {project_number}번을 선택합니다...",
@@ -283,9 +327,10 @@ class ConversationManager:
             return None
 
         # We're at the initial selection screen (신규/기존/건너뛰기)
+        option = _PROJECT_OPTION_REPLIES.get(msg)
 
         # Option 1: Create new project
-        if msg in ["1", "1번", "신규"]:
+        if option == 1:
             return GeminiActionResponse(
                 action=ActionType.ASK_CLARIFICATION,
                 message="신규 프로젝트를 생성합니다. 프로젝트 이름을 입력해주세요.\n\n예시: 이미지 분류 프로젝트 - 설명",
@@ -293,14 +338,14 @@ class ConversationManager:
             )
 
         # Option 2: Select existing project
-        if msg in ["2", "2번", "기존"]:
+        if option == 2:
             return GeminiActionResponse(
                 action=ActionType.SHOW_PROJECT_LIST,
                 message="기존 프로젝트를 조회합니다..."
             )
 
         # Option 3: Skip project
-        if msg in ["3", "3번", "건너뛰기", "없이"]:
+        if option == 3:
             return GeminiActionResponse(
                 action=ActionType.SKIP_PROJECT,
                 message="프로젝트 없이 진행합니다."
@@ -309,37 +354,48 @@ class ConversationManager:
         # Not a simple option - let LLM handle it
         return None
 
-    def _build_context(self, session: SessionModel, max_messages: int = 10) -> str:
+    def _get_context_lines(self, session: SessionModel, max_messages: int = 10) -> Deque[str]:
         """
-        Build conversation context from recent messages
+        Get the session's recent messages as formatted context lines
+
+        Served from the in-process cache while it matches the session's
+        updated_at; otherwise rebuilt from the DB.
 
         Args:
             session: Current session
             max_messages: Maximum number of messages to include
 
         Returns:
-            str: Formatted conversation history
+            deque: Formatted lines in chronological order (maxlen=max_messages)
         """
-        messages = (
-            self.db.query(MessageModel)
+        entry = _context_cache.get(session.id)
+        if entry is not None and entry[0] == session.updated_at and entry[1].maxlen == max_messages:
+            _context_cache.move_to_end(session.id)
+            return deque(entry[1], maxlen=max_messages)
+
+        # Only role/content are rendered: select those columns as plain rows.
+        # Messages are append-only, so id order is chronological order and
+        # (session_id, id) serves the ORDER BY ... LIMIT without a sort.
+        rows = (
+            self.db.query(MessageModel.role, MessageModel.content)
             .filter(MessageModel.session_id == session.id)
-            .order_by(MessageModel.created_at.desc())
+            .order_by(MessageModel.id.desc())
             .limit(max_messages)
             .all()
         )
 
-        # Reverse to chronological order
-        messages = list(reversed(messages))
-
-        if not messages:
-            return ""
-
-        context_lines = []
-        for msg in messages:
-            role = "User" if msg.role == "user" else "Assistant"
-            context_lines.append(f"{role}: {msg.content}")
+        # Newest-first from SQL; keep in chronological order
+        return deque(
+            (_format_context_line(role, content) for role, content in reversed(rows)),
+            maxlen=max_messages,
+        )
 
-        return "\n".join(context_lines)
+    def _remember_context(self, session_id: int, updated_at: datetime, lines: Deque[str]) -> None:
+        """Cache context lines for the session version stamped with updated_at"""
+        _context_cache[session_id] = (updated_at, lines)
+        _context_cache.move_to_end(session_id)
+        if len(_context_cache) > CONTEXT_CACHE_MAXSIZE:
+            _context_cache.popitem(last=False)
 
     async def create_new_session(self) -> SessionModel:
         """
@@ -369,9 +425,9 @@ class ConversationManager:
         Returns:
             dict: Session info or None if not found
         """
-        session = self.db.query(SessionModel).filter(
-            SessionModel.id == session_id
-        ).first()
+        session = self.db.execute(
+            _SESSION_BY_ID, {"session_id": session_id}
+        ).scalar_one_or_none()
 
         if not session:
             return None
@@ -400,9 +456,9 @@ class ConversationManager:
         Returns:
             bool: True if successful, False if session not found
         """
-        session = self.db.query(SessionModel).filter(
-            SessionModel.id == session_id
-        ).first()
+        session = self.db.execute(
+            _SESSION_BY_ID, {"session_id": session_id}
+        ).scalar_one_or_none()
 
         if not session:
             return False
@@ -9,7 +9,38 @@ import logging
 logger = logging.getLogger(__name__)
 
 # Supported image extensions
-IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tiff", ".webp"}
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tiff", ".webp"})
+
+
+def is_image_filename(name: str) -> bool:
+    """Check a filename's extension against IMAGE_EXTENSIONS.
+
+    Splits off the extension and tests set membership; only the short
+    extension is lowercased, and only when the exact-case lookup misses.
+    """
+    ext = os.path.splitext(name)[1]
+    return ext in IMAGE_EXTENSIONS or ext.lower() in IMAGE_EXTENSIONS
+
+
+def _scan_images(path: str) -> Tuple[int, int]:
+    """Recursively count images and their total size in bytes.
+
+    Uses os.scandir so file type and stat info come from the directory
+    read (DirEntry caches them) instead of one extra stat() per file.
+    """
+    count = 0
+    total_bytes = 0
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False):
+                if is_image_filename(entry.name):
+                    count += 1
+                    total_bytes += entry.stat(follow_symlinks=False).st_size
+            elif entry.is_dir(follow_symlinks=False):
+                sub_count, sub_bytes = _scan_images(entry.path)
+                count += sub_count
+                total_bytes += sub_bytes
+    return count, total_bytes
 
 
 class DatasetAnalyzer:
@@ -163,17 +194,15 @@ class DatasetAnalyzer:
         if not path.is_dir():
             return False
 
-        for file in path.iterdir():
-            if file.is_file() and file.suffix.lower() in IMAGE_EXTENSIONS:
-                return True
-        return False
+        with os.scandir(path) as it:
+            return any(
+                entry.is_file() and is_image_filename(entry.name)
+                for entry in it
+            )
 
     def _count_images(self, path: Path) -> int:
         """Count total images in a directory (recursively)."""
-        count = 0
-        for file in path.rglob("*"):
-            if file.is_file() and file.suffix.lower() in IMAGE_EXTENSIONS:
-                count += 1
+        count, _ = _scan_images(str(path))
         return count
 
     def _analyze_imagefolder(self, path: Path) -> Dict:
@@ -423,7 +452,7 @@ class DatasetAnalyzer:
 
     def _analyze_unlabeled(self, path: Path) -> Dict:
         """Analyze unlabeled image directory."""
-        total_images = self._count_images(path)
+        total_images, total_bytes = _scan_images(str(path))
 
         return {
             "format": "Unlabeled",
@@ -431,6 +460,7 @@ class DatasetAnalyzer:
             "class_names": [],
             "is_labeled": False,
             "total_images": total_images,
+            "total_size_bytes": total_bytes,
             "has_train_val_split": False,
             "warnings": [
                 "Dataset appears to be unlabeled - cannot use for supervised learning",
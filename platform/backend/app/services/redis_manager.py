@@ -583,6 +583,28 @@ class RedisManager:
             logger.error(f"Redis KEYS failed for pattern {pattern}: {e}")
             return []
 
+    async def scan_keys(self, pattern: str = "*", count: int = 500) -> List[str]:
+        """Get keys matching pattern with incremental SCAN.
+
+        Unlike KEYS, SCAN walks the keyspace in batches without blocking
+        the server, so it is safe on large production datasets.
+
+        Args:
+            pattern: Key pattern (e.g., "session:*")
+            count: Hint for how many keys Redis examines per SCAN call
+
+        Returns:
+            List of matching keys
+        """
+        if not self._client:
+            return []
+
+        try:
+            return [key async for key in self._client.scan_iter(match=pattern, count=count)]
+        except RedisError as e:
+            logger.error(f"Redis SCAN failed for pattern {pattern}: {e}")
+            return []
+
     async def flushdb(self) -> bool:
         """Delete all keys in current database.
 
@@ -0,0 +1,157 @@
+"""Short-lived response cache for read-heavy list endpoints.
+
+Dashboard endpoints (admin project/user lists, available datasets) are
+refreshed far more often than their underlying data changes. This module
+caches their JSON-ready responses for a short TTL.
+
+Design:
+- Redis-backed when a RedisManager is attached at startup (shared across instances)
+- Falls back to an in-process TTL dict when Redis is unavailable. The
+  fallback is per worker process: invalidation only clears the worker that
+  handled the write, so other workers may serve stale lists until the TTL
+  expires. Keep TTLs short for lists that are invalidated on write.
+- Values are stored JSON-encoded; callers pass JSON-compatible data
+- Key format: mvp:{area}:{resource}:{params...}
+
+See: docs/architecture/REDIS_INTEGRATION_DESIGN.md
+"""
+
+import fnmatch
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+import orjson
+
+from app.services.redis_manager import RedisManager
+
+logger = logging.getLogger(__name__)
+
+# Key prefixes
+ADMIN_PROJECTS_KEY_PREFIX = "mvp:admin:projects"
+ADMIN_USERS_KEY_PREFIX = "mvp:admin:users"
+DATASETS_AVAILABLE_KEY_PREFIX = "mvp:datasets:available"
+PROJECTS_LIST_KEY_PREFIX = "mvp:projects:list"
+LLM_RESPONSE_KEY_PREFIX = "mvp:llm:responses"
+LLM_INTENT_KEY_PREFIX = "mvp:llm:intents"
+
+
+class ResponseCache:
+    """TTL cache for endpoint responses with Redis primary and local fallback.
+
+    Usage:
+        value = await response_cache.get_or_set(key, ttl=60, loader=load_rows)
+        await response_cache.delete_pattern("mvp:admin:*")
+    """
+
+    def __init__(self, redis_manager: Optional[RedisManager] = None, local_maxsize: int = 128):
+        """Initialize response cache.
+
+        Args:
+            redis_manager: Connected RedisManager, or None to use the local cache only
+            local_maxsize: Maximum number of entries kept in the in-process fallback
+        """
+        self.redis = redis_manager
+        self.local_maxsize = local_maxsize
+        self._local: Dict[str, Tuple[float, Any]] = {}
+
+    @property
+    def _use_redis(self) -> bool:
+        return self.redis is not None and self.redis.is_connected
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None on miss."""
+        if self._use_redis:
+            raw = await self.redis.get(key)
+            return orjson.loads(raw) if raw is not None else None
+
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._local.pop(key, None)
+            return None
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        """Cache a JSON-compatible value for ttl seconds."""
+        if self._use_redis:
+            await self.redis.set(key, orjson.dumps(value).decode(), ttl=ttl)
+            return
+
+        if len(self._local) >= self.local_maxsize:
+            self._evict_local()
+        self._local[key] = (time.monotonic() + ttl, value)
+
+    async def get_or_set(
+        self,
+        key: str,
+        ttl: int,
+        loader: Callable[[], Union[Any, Awaitable[Any]]],
+    ) -> Any:
+        """Return the cached value for key, calling loader to fill it on a miss.
+
+        Args:
+            key: Cache key
+            ttl: Time to live in seconds
+            loader: Sync or async callable returning a JSON-compatible value
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+
+        value = loader()
+        if hasattr(value, "__await__"):
+            value = await value
+
+        await self.set(key, value, ttl)
+        return value
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """Invalidate all keys matching a glob pattern.
+
+        Uses SCAN rather than KEYS so invalidation never blocks Redis. With
+        the local fallback only this worker's entries are dropped.
+
+        Returns:
+            Number of keys deleted
+        """
+        if self._use_redis:
+            keys = await self.redis.scan_keys(pattern)
+            return await self.redis.delete(*keys) if keys else 0
+
+        matched = [key for key in self._local if fnmatch.fnmatchcase(key, pattern)]
+        for key in matched:
+            del self._local[key]
+        return len(matched)
+
+    def _evict_local(self) -> None:
+        """Drop expired local entries, or the oldest one if none expired."""
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self._local.items() if expires_at < now]
+        for key in expired:
+            del self._local[key]
+        if not expired and self._local:
+            del self._local[next(iter(self._local))]
+
+
+# Global instance (Redis is attached in app startup when available)
+response_cache = ResponseCache()
+
+
+async def invalidate_admin_lists() -> None:
+    """Drop cached admin project/user lists (run after a mutation commits)."""
+    await response_cache.delete_pattern("mvp:admin:*")
+
+
+async def invalidate_project_lists() -> None:
+    """Drop cached per-user project lists (run after a project or membership change).
+
+    A project appears in its owner's and every member's list, so all users'
+    entries are dropped rather than tracking who can see which project.
+    """
+    await response_cache.delete_pattern(f"{PROJECTS_LIST_KEY_PREFIX}:*")
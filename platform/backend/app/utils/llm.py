@@ -13,10 +13,19 @@ Configuration via environment variables:
 - GOOGLE_API_KEY: API key for Google Gemini
 """
 
+import hashlib
 import json
+import logging
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
+import orjson
+
 from app.core.config import settings
+from app.services.response_cache import LLM_RESPONSE_KEY_PREFIX, response_cache
+from app.utils.llm_structured import read_json_object, strip_code_fence
+
+logger = logging.getLogger(__name__)
 
 
 class IntentParser:
@@ -28,6 +37,8 @@ class IntentParser:
         self.model_name = settings.LLM_MODEL
         self.temperature = settings.LLM_TEMPERATURE
         self.system_prompt = self.SYSTEM_PROMPT
+        # Shared by every request; message dicts are never mutated downstream
+        self._system_message = {"role": "system", "content": self.system_prompt}
 
         if self.provider == "gemini":
             self._init_gemini()
@@ -53,18 +64,24 @@ class IntentParser:
             }
         )
 
+    def _cache_key(self, messages: list) -> str:
+        """Cache key for a prompt: provider, model, temperature and all messages."""
+        payload = orjson.dumps([self.provider, self.model_name, self.temperature, messages])
+        return f"{LLM_RESPONSE_KEY_PREFIX}:{hashlib.sha256(payload).hexdigest()}"
+
     async def _call_openai(self, messages: list) -> str:
-        """Call OpenAI-compatible API."""
-        response = await self.client.chat.completions.create(
+        """Call OpenAI-compatible API (streamed, cut at the end of the JSON)."""
+        stream = await self.client.chat.completions.create(
             model=self.model_name,
             messages=messages,
             temperature=self.temperature,
+            stream=True,
         )
-        return response.choices[0].message.content
+        texts = (chunk.choices[0].delta.content if chunk.choices else None async for chunk in stream)
+        return await read_json_object(texts, stream.response.aclose)
 
     async def _call_gemini(self, messages: list) -> str:
-        """Call Google Gemini API."""
-        import asyncio
+        """Call Google Gemini API (streamed, cut at the end of the JSON)."""
         # Convert messages to single prompt for Gemini
         prompt_parts = []
         for msg in messages:
@@ -74,12 +91,10 @@ class IntentParser:
                 prompt_parts.append(f"\n{msg['content']}")
         full_prompt = "\n".join(prompt_parts)
 
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: self.gemini_model.generate_content(full_prompt)
-        )
-        return response.text
+        response = await self.gemini_model.generate_content_async(full_prompt, stream=True)
+        chunks = aiter(response)
+        texts = (chunk.text async for chunk in chunks if chunk.parts)
+        return await read_json_object(texts, chunks.aclose)
 
     # System prompt for intent parsing
     SYSTEM_PROMPT = """You are an AI assistant for a computer vision training platform.
@@ -525,9 +540,7 @@ IMPORTANT: Do not wrap the JSON in markdown code blocks. Return raw JSON directl
             Dictionary with parsing result
         """
         # Build messages for OpenAI format
-        messages = [
-            {"role": "system", "content": self.system_prompt},
-        ]
+        messages = [self._system_message]
 
         if context:
             messages.append({"role": "user", "content": f"Previous context: {context}"})
@@ -539,37 +552,41 @@ IMPORTANT: Do not wrap the JSON in markdown code blocks. Return raw JSON directl
 
         messages.append({"role": "user", "content": f"User message: {user_message}"})
 
+        # Identical prompts (UI retries, refreshes) reuse the earlier parse.
+        # Backed by Redis when attached at startup, else the in-process cache.
+        cache_key = self._cache_key(messages)
+        if settings.LLM_RESPONSE_CACHE_TTL > 0:
+            cached = await response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             # Call LLM based on provider
             if self.provider == "gemini":
                 content = await self._call_gemini(messages)
             else:
                 content = await self._call_openai(messages)
-            print(f"[DEBUG] LLM raw response content: {content}")
+            logger.debug("LLM raw response content: %s", content)
 
             # Remove markdown code blocks if present
-            content = content.strip()
-            if content.startswith("```json"):
-                content = content[7:]  # Remove ```json
-            elif content.startswith("```"):
-                content = content[3:]  # Remove ```
-            if content.endswith("```"):
-                content = content[:-3]  # Remove trailing ```
-            content = content.strip()
-
-            print(f"[DEBUG] Cleaned content: {content}")
-            result = json.loads(content)
+            content = strip_code_fence(content.strip())
+
+            logger.debug("Cleaned content: %s", content)
+            result = orjson.loads(content)
+
+            # Only successful parses are cached; errors are retried next time
+            if settings.LLM_RESPONSE_CACHE_TTL > 0:
+                await response_cache.set(cache_key, result, settings.LLM_RESPONSE_CACHE_TTL)
             return result
-        except json.JSONDecodeError as e:
-            print(f"[DEBUG] JSON decode error: {str(e)}")
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
+            logger.warning("JSON decode error: %s", e)
             return {
                 "status": "error",
                 "error": "Failed to parse LLM response",
                 "detail": str(e),
             }
         except Exception as e:
-            print(f"[DEBUG] LLM exception: {str(e)}")
-            print(f"[DEBUG] Exception type: {type(e)}")
+            logger.error("LLM request failed: %s", e, exc_info=True)
             return {
                 "status": "error",
                 "error": "LLM request failed",
@@ -620,5 +637,11 @@ IMPORTANT: Do not wrap the JSON in markdown code blocks. Return raw JSON directl
             return "죄송합니다. 요청을 처리하는 중 오류가 발생했습니다."
 
 
-# Global instance
-intent_parser = IntentParser()
+@lru_cache(maxsize=1)
+def get_intent_parser() -> IntentParser:
+    """Return the shared IntentParser, created on first use.
+
+    Construction configures the LLM client, so it is deferred until the
+    first chat message instead of running at import time.
+    """
+    return IntentParser()
@@ -9,11 +9,17 @@ Supported providers:
 - gemini: Google Gemini API
 """
 
-import json
+import hashlib
 import logging
-from typing import Optional, Dict, Any
+import re
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+import orjson
+from pydantic import ValidationError
 
 from app.core.config import settings
+from app.services.response_cache import LLM_INTENT_KEY_PREFIX, response_cache
 from app.models.conversation import (
     ActionType,
     GeminiActionResponse,  # Keep name for backward compatibility
@@ -22,6 +28,149 @@ from app.models.conversation import (
 
 logger = logging.getLogger(__name__)
 
+# Markdown code fence around a reply (```json ... ```, any language tag).
+# The closing fence is optional: streamed replies are cut at the end of the JSON.
+_CODE_FENCE_RE = re.compile(r"\A```[\w-]*\s*(.*?)\s*(?:```.*)?\Z", re.DOTALL)
+
+# User-turn prompt, filled once per call. Sections stay in a fixed order
+# (history -> config -> user message) so the prompt prefix is byte-stable.
+_USER_PROMPT_TEMPLATE = "{history}{config}\n\n=== USER MESSAGE ===\n{user_message}\n{json_instruction}"
+_HISTORY_SECTION = "\n\n=== CONVERSATION HISTORY ===\n{context}\n"
+_CONFIG_SECTION = (
+    "\n\n=== CURRENT CONFIG (YOU MUST INCLUDE ALL OF THESE IN YOUR RESPONSE!) ===\n{config}\n"
+    "\n🚨 MANDATORY: Your response MUST include these {count} fields: {fields}\n"
+)
+
+# Shared head of every state-specific system prompt
+_BASE_SYSTEM_PROMPT = """You are an AI assistant for a computer vision training platform.
+
+LANGUAGE REQUIREMENT:
+- You MUST respond in Korean (한국어) at all times
+- All messages must be in Korean
+- Never respond in English unless explicitly asked
+
+You must respond with structured JSON containing:
+- action: one of the supported action types
+- message: user-friendly message in Korean
+- other fields based on action type
+
+SUPPORTED ACTIONS (Training Setup):
+1. ask_clarification: Need more information
+2. show_project_options: Show project selection menu (1: new, 2: existing, 3: skip)
+3. show_project_list: List available projects
+4. create_project: Create new project
+5. select_project: Select existing project
+6. skip_project: Skip project (use Uncategorized)
+7. confirm_training: Ask for final confirmation
+8. start_training: Start training (final action)
+9. error: Error occurred
+
+PHASE 1 ACTIONS (Dataset/Model/Training Control):
+10. analyze_dataset: Analyze dataset structure and quality
+    - Use when user provides dataset path and wants analysis
+11. show_dataset_analysis: Display dataset analysis results
+12. list_datasets: List available datasets
+    - Use when user asks: "기본 데이터셋", "사용 가능한 데이터셋", "어떤 데이터셋이 있어", "built-in datasets"
+    - Lists datasets from C:\datasets (built-in) and other paths
+13. search_models: Search for models by task/framework
+14. show_model_info: Show detailed model information
+15. recommend_models: Recommend models based on dataset
+16. show_training_status: Show training progress and metrics
+17. stop_training: Stop running training job
+18. list_training_jobs: List training jobs with filters
+19. start_quick_inference: Run inference on single image
+
+"""
+
+# States whose replies depend only on the user's (short) input and the
+# current config/project choices, not on the conversation history, so
+# identical inputs can reuse an earlier parse ("네", "1번", ...)
+_CACHEABLE_STATES = frozenset({
+    ConversationState.CONFIRMING,
+    ConversationState.SELECTING_PROJECT,
+})
+
+# Messages at least this long that still come back as ask_clarification are
+# retried once on LLM_MODEL_HEAVY (short ones are usually genuinely ambiguous)
+HEAVY_RETRY_MIN_CHARS = 50
+
+_JSON_INSTRUCTION = (
+    "\n\n**IMPORTANT**: Respond ONLY with valid JSON. No markdown, no code blocks, "
+    "no explanations. Just the JSON object."
+)
+
+
+def strip_code_fence(text: str) -> str:
+    """Return the content of a fenced reply, or the text unchanged if not fenced"""
+    match = _CODE_FENCE_RE.match(text)
+    return match.group(1) if match else text
+
+
+class JsonObjectScanner:
+    """
+    Find where the first top-level JSON object in a streamed reply ends
+
+    Replies are read as a stream and cut off as soon as the object closes,
+    so trailing markdown fences or explanations are never waited for.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> int:
+        """Scan the next chunk; return the offset just past the closing brace, or -1"""
+        for i, ch in enumerate(text):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = self.started
+            elif ch == "{":
+                self.depth += 1
+                self.started = True
+            elif ch == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+        return -1
+
+
+async def read_json_object(chunks: AsyncIterator[Optional[str]], close: Callable[[], Awaitable[None]]) -> str:
+    """
+    Read streamed reply text up to the end of the first top-level JSON object
+
+    Empty chunks are skipped. close() always runs afterwards (early stop, end
+    of stream or error), so the provider stream is released either way.
+
+    Args:
+        chunks: Reply text chunks, already adapted from the provider SDK
+        close: Releases the underlying provider stream
+
+    Returns:
+        Text read up to the closing brace (all text if the object never closes)
+    """
+    scanner = JsonObjectScanner()
+    parts = []
+    try:
+        async for text in chunks:
+            if not text:
+                continue
+            end = scanner.feed(text)
+            if end >= 0:
+                parts.append(text[:end])
+                break
+            parts.append(text)
+    finally:
+        await close()
+    return "".join(parts)
+
 
 class StructuredIntentParser:
     """
@@ -37,13 +186,24 @@ class StructuredIntentParser:
         self.provider = settings.LLM_PROVIDER.lower()
         self.model_name = settings.LLM_MODEL
         self.temperature = settings.LLM_TEMPERATURE
+        # An empty LLM_MODEL_HEAVY= means disabled, same as unset
+        self.heavy_model_name = settings.LLM_MODEL_HEAVY or None
 
         if self.provider == "gemini":
             self._init_gemini()
         else:
             self._init_openai()
 
-        logger.info(f"LLM Provider initialized: {self.provider}, Model: {self.model_name}")
+        # Prompts are static per state: build once, so every turn sends a
+        # byte-identical prefix (lets provider-side prompt caching hit)
+        self._system_prompts: Dict[ConversationState, str] = {
+            state: self._compose_system_prompt(state) for state in ConversationState
+        }
+
+        logger.info(
+            f"LLM Provider initialized: {self.provider}, Model: {self.model_name}, "
+            f"Heavy model: {self.heavy_model_name or 'disabled'}"
+        )
 
     def _init_openai(self):
         """Initialize OpenAI-compatible client"""
@@ -57,83 +217,93 @@ class StructuredIntentParser:
         """Initialize Google Gemini client"""
         import google.generativeai as genai
         genai.configure(api_key=settings.GOOGLE_API_KEY)
+        generation_config = {
+            "temperature": self.temperature,
+            # JSON mode: constrained decoding emits a bare JSON object (no fences)
+            "response_mime_type": "application/json",
+        }
         self.gemini_model = genai.GenerativeModel(
             model_name=self.model_name,
-            generation_config={
-                "temperature": self.temperature,
-            }
+            generation_config=generation_config
         )
-
-    async def _call_openai(self, system_prompt: str, user_content: str) -> str:
-        """Call OpenAI-compatible API and return response text"""
-        response = await self.client.chat.completions.create(
-            model=self.model_name,
+        self.gemini_heavy_model = genai.GenerativeModel(
+            model_name=self.heavy_model_name,
+            generation_config=generation_config
+        ) if self.heavy_model_name else None
+
+    async def _call_openai(self, system_prompt: str, user_content: str, heavy: bool = False) -> str:
+        """Call OpenAI-compatible API and return response text (streamed, cut at the end of the JSON)"""
+        stream = await self.client.chat.completions.create(
+            model=self.heavy_model_name if heavy else self.model_name,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_content}
             ],
             temperature=self.temperature,
+            stream=True,
         )
-        return response.choices[0].message.content.strip()
+        texts = (chunk.choices[0].delta.content if chunk.choices else None async for chunk in stream)
+        return (await read_json_object(texts, stream.response.aclose)).strip()
 
-    async def _call_gemini(self, system_prompt: str, user_content: str) -> str:
-        """Call Google Gemini API and return response text"""
-        import asyncio
+    async def _call_gemini(self, system_prompt: str, user_content: str, heavy: bool = False) -> str:
+        """Call Google Gemini API and return response text (streamed, cut at the end of the JSON)"""
         # Gemini uses a single prompt format
         full_prompt = f"{system_prompt}\n\n{user_content}"
-        # Run sync Gemini call in executor for async compatibility
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: self.gemini_model.generate_content(full_prompt)
-        )
-        return response.text.strip()
 
-    def _build_system_prompt(self, state: ConversationState) -> str:
-        """Build state-specific system prompt"""
-
-        base_prompt = """You are an AI assistant for a computer vision training platform.
-
-LANGUAGE REQUIREMENT:
-- You MUST respond in Korean (한국어) at all times
-- All messages must be in Korean
-- Never respond in English unless explicitly asked
+        model = self.gemini_heavy_model if heavy else self.gemini_model
+        response = await model.generate_content_async(full_prompt, stream=True)
+        chunks = aiter(response)
+        texts = (chunk.text async for chunk in chunks if chunk.parts)
+        return (await read_json_object(texts, chunks.aclose)).strip()
 
-You must respond with structured JSON containing:
-- action: one of the supported action types
-- message: user-friendly message in Korean
-- other fields based on action type
+    async def _call_llm(self, system_prompt: str, user_content: str, heavy: bool = False) -> str:
+        """Call the configured provider (heavy=True uses LLM_MODEL_HEAVY)"""
+        if self.provider == "gemini":
+            return await self._call_gemini(system_prompt, user_content, heavy)
+        return await self._call_openai(system_prompt, user_content, heavy)
+
+    def _should_retry_heavy(self, action_response: GeminiActionResponse, user_message: str) -> bool:
+        """Whether a clarification request for a detailed message deserves a heavy-model retry"""
+        return (
+            self.heavy_model_name is not None
+            and action_response.action == ActionType.ASK_CLARIFICATION
+            and len(user_message) >= HEAVY_RETRY_MIN_CHARS
+        )
 
-SUPPORTED ACTIONS (Training Setup):
-1. ask_clarification: Need more information
-2. show_project_options: Show project selection menu (1: new, 2: existing, 3: skip)
-3. show_project_list: List available projects
-4. create_project: Create new project
-5. select_project: Select existing project
-6. skip_project: Skip project (use Uncategorized)
-7. confirm_training: Ask for final confirmation
-8. start_training: Start training (final action)
-9. error: Error occurred
+    def _intent_cache_key(
+        self,
+        state: ConversationState,
+        user_message: str,
+        temp_data: Optional[Dict[str, Any]]
+    ) -> Optional[str]:
+        """Cache key for an intent parse, or None if the state is not cacheable"""
+        if state not in _CACHEABLE_STATES:
+            return None
+        normalized = " ".join(user_message.lower().split())
+        temp_data = temp_data or {}
+        # "1번" means a different project once the offered list or the
+        # selection changes, so both are part of the key
+        payload = orjson.dumps(
+            [
+                self.provider, self.model_name, self.temperature, state.value, normalized,
+                temp_data.get("config"),
+                temp_data.get("available_projects"),
+                temp_data.get("selected_project_id"),
+            ],
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return f"{LLM_INTENT_KEY_PREFIX}:{hashlib.sha256(payload).hexdigest()}"
 
-PHASE 1 ACTIONS (Dataset/Model/Training Control):
-10. analyze_dataset: Analyze dataset structure and quality
-    - Use when user provides dataset path and wants analysis
-11. show_dataset_analysis: Display dataset analysis results
-12. list_datasets: List available datasets
-    - Use when user asks: "기본 데이터셋", "사용 가능한 데이터셋", "어떤 데이터셋이 있어", "built-in datasets"
-    - Lists datasets from C:\datasets (built-in) and other paths
-13. search_models: Search for models by task/framework
-14. show_model_info: Show detailed model information
-15. recommend_models: Recommend models based on dataset
-16. show_training_status: Show training progress and metrics
-17. stop_training: Stop running training job
-18. list_training_jobs: List training jobs with filters
-19. start_quick_inference: Run inference on single image
+    def _build_system_prompt(self, state: ConversationState) -> str:
+        """Get the state-specific system prompt (precomputed in __init__)"""
+        return self._system_prompts[state]
 
-"""
+    @staticmethod
+    def _compose_system_prompt(state: ConversationState) -> str:
+        """Compose state-specific system prompt"""
 
         if state == ConversationState.INITIAL or state == ConversationState.GATHERING_CONFIG:
-            return base_prompt + """
+            return _BASE_SYSTEM_PROMPT + """
 CURRENT STATE: Gathering training configuration
 
 Your task: Extract training configuration from user messages.
@@ -164,59 +334,12 @@ OPTIONAL FIELDS:
 - num_classes (for classification)
 - dataset_format (default: imagefolder)
 
-═══════════════════════════════════════════════════════════════
-🚨 CRITICAL RULE - READ THIS CAREFULLY 🚨
-═══════════════════════════════════════════════════════════════
-
-**RULE #1: NEVER DROP PREVIOUS VALUES**
-When you receive current_config in the context, you MUST include EVERY SINGLE field from it in your response.
-
-Example (CORRECT):
-Context: current_config = {"framework": "timm", "model_name": "resnet18"}
-User: "C:\\datasets\\cls\\imagenet-10"
-Your response current_config MUST have:
-{
-  "framework": "timm",          ← KEEP from context
-  "model_name": "resnet18",     ← KEEP from context
-  "dataset_path": "C:\\datasets\\cls\\imagenet-10"  ← ADD new
-}
-
-Example (WRONG - DO NOT DO THIS):
-{
-  "dataset_path": "C:\\datasets\\cls\\imagenet-10"  ← Missing framework and model_name!
-}
-
-**RULE #2: COPY-PASTE PREVIOUS VALUES**
-If you see a field in the context's current_config, COPY IT EXACTLY to your response.
-DO NOT try to "simplify" or "optimize" by removing fields.
-
-**RULE #3: VALIDATION CHECKLIST**
-Before returning your response, check:
-[ ] Did I copy ALL fields from context's current_config?
-[ ] Did I add the new information from user's message?
-[ ] Is my current_config a SUPERSET of the previous one?
-
-═══════════════════════════════════════════════════════════════
-
-🚨 ACTION SELECTION RULES - CRITICAL 🚨
-═══════════════════════════════════════════════════════════════
-**BEFORE choosing ask_clarification, CHECK THESE RULES FIRST:**
+CONFIG RULE: current_config in your response MUST contain every field from CURRENT CONFIG, copied exactly, plus any new values from the user's message (a superset, never fewer fields).
 
-1. If user asks about "기본 데이터셋", "사용 가능한 데이터셋", "어떤 데이터셋", "built-in dataset", "제공되는 데이터셋"
-   → **MUST use action="list_datasets"**
-   → Do NOT use ask_clarification for this!
-
-   Example:
-   User: "기본으로 제공되는 데이터셋이 있어?"
-   ✅ CORRECT: {"action": "list_datasets", "message": "사용 가능한 데이터셋을 확인하고 있습니다..."}
-   ❌ WRONG: {"action": "ask_clarification", "message": "기본으로 제공되는 데이터셋은 없습니다..."}
-
-2. If user provides dataset path (e.g., "C:\\datasets\\...") and wants analysis
-   → action="analyze_dataset"
-
-3. If user asks about model features/comparison
-   → action="search_models" or "show_model_info"
-═══════════════════════════════════════════════════════════════
+ACTION SELECTION (check before choosing ask_clarification):
+1. User asks about provided datasets ("기본 데이터셋", "사용 가능한 데이터셋", "어떤 데이터셋", "built-in dataset", "제공되는 데이터셋") → action="list_datasets", message="사용 가능한 데이터셋을 확인하고 있습니다..."
+2. User gives a dataset path (e.g., "C:\\datasets\\...") and wants analysis → action="analyze_dataset"
+3. User asks about model features/comparison → action="search_models" or "show_model_info"
 
 INFERENCE RULES:
 1. If user mentions "ResNet" or "EfficientNet" → framework="timm", task_type="image_classification"
@@ -274,36 +397,8 @@ Return action="show_project_options" with the complete config (including ALL pre
 WHEN INFO IS MISSING:
 Return action="ask_clarification" with missing_fields list AND current_config with ALL collected values.
 
-Example conversation flow (CRITICAL - follow this pattern):
-
-User: "ResNet으로 학습하고 싶어"
-You return:
-```json
-{
-  "action": "ask_clarification",
-  "message": "ResNet 모델을 선택하셨습니다. 어떤 ResNet 모델을 사용하시겠어요? (resnet18, resnet50)",
-  "missing_fields": ["model_name", "dataset_path", "epochs", "batch_size", "learning_rate"],
-  "current_config": {"framework": "timm", "task_type": "image_classification"}
-}
-```
-
-User: "resnet18"
-You return (NOTE: MUST include previous values!):
-```json
-{
-  "action": "ask_clarification",
-  "message": "resnet18 모델을 선택했습니다. 데이터셋 경로를 알려주세요.",
-  "missing_fields": ["dataset_path", "epochs", "batch_size", "learning_rate"],
-  "current_config": {
-    "framework": "timm",
-    "task_type": "image_classification",
-    "model_name": "resnet18"
-  }
-}
-```
-
+Example (previous CURRENT CONFIG: {"framework": "timm", "task_type": "image_classification", "model_name": "resnet18"}):
 User: "C:\\datasets\\cls\\imagenet-10"
-You return (NOTE: MUST include all previous values!):
 ```json
 {
   "action": "ask_clarification",
@@ -318,34 +413,10 @@ You return (NOTE: MUST include all previous values!):
   }
 }
 ```
-
-User: "기본값으로 해줘"
-You return (NOTE: Complete config with ALL fields!):
-```json
-{
-  "action": "show_project_options",
-  "message": "설정이 완료되었습니다. 프로젝트를 선택해주세요.\\n\\n1️⃣ 신규 프로젝트 생성\\n2️⃣ 기존 프로젝트 선택\\n3️⃣ 프로젝트 없이 실험만 진행",
-  "config": {
-    "framework": "timm",
-    "model_name": "resnet18",
-    "task_type": "image_classification",
-    "dataset_path": "C:\\\\datasets\\\\cls\\\\imagenet-10",
-    "dataset_format": "imagefolder",
-    "num_classes": null,
-    "epochs": 50,
-    "batch_size": 32,
-    "learning_rate": 0.001
-  }
-}
-```
-
-═══════════════════════════════════════════════════════════════
-🔴 REMEMBER: ALWAYS INCLUDE ALL PREVIOUS CONFIG FIELDS! 🔴
-═══════════════════════════════════════════════════════════════
 """
 
         elif state == ConversationState.SELECTING_PROJECT:
-            return base_prompt + """
+            return _BASE_SYSTEM_PROMPT + """
 CURRENT STATE: Selecting project
 
 User is choosing from 3 options. Check the user's message EXACTLY:
@@ -396,7 +467,7 @@ Example for "3":
 """
 
         elif state == ConversationState.CREATING_PROJECT:
-            return base_prompt + """
+            return _BASE_SYSTEM_PROMPT + """
 CURRENT STATE: Creating new project
 
 User is providing project name and optional description.
@@ -431,7 +502,7 @@ Examples:
 """
 
         elif state == ConversationState.CONFIRMING:
-            return base_prompt + """
+            return _BASE_SYSTEM_PROMPT + """
 CURRENT STATE: Confirming training
 
 User needs to confirm whether to start training.
@@ -452,7 +523,7 @@ Example:
         # ========== Phase 1 New States ==========
 
         elif state == ConversationState.ANALYZING_DATASET:
-            return base_prompt + """
+            return _BASE_SYSTEM_PROMPT + """
 CURRENT STATE: Analyzing dataset
 
 Dataset analysis has been completed or user is asking about dataset.
@@ -479,7 +550,7 @@ Example:
 """
 
         elif state == ConversationState.SELECTING_MODEL:
-            return base_prompt + """
+            return _BASE_SYSTEM_PROMPT + """
 CURRENT STATE: Selecting model
 
 User is choosing a model or requesting model information.
@@ -512,7 +583,7 @@ Example:
 """
 
         elif state == ConversationState.MONITORING_TRAINING:
-            return base_prompt + """
+            return _BASE_SYSTEM_PROMPT + """
 CURRENT STATE: Monitoring training
 
 User is checking training status or managing training jobs.
@@ -539,7 +610,7 @@ Example:
 """
 
         elif state == ConversationState.RUNNING_INFERENCE:
-            return base_prompt + """
+            return _BASE_SYSTEM_PROMPT + """
 CURRENT STATE: Running inference
 
 User wants to run inference on images.
@@ -564,7 +635,7 @@ Example:
 """
 
         elif state == ConversationState.VIEWING_RESULTS:
-            return base_prompt + """
+            return _BASE_SYSTEM_PROMPT + """
 CURRENT STATE: Viewing results
 
 User is viewing training or inference results.
@@ -586,7 +657,7 @@ Example:
 """
 
         elif state == ConversationState.IDLE:
-            return base_prompt + """
+            return _BASE_SYSTEM_PROMPT + """
 CURRENT STATE: Idle (waiting for user request)
 
 User can request any action. Analyze their intent and route to:
@@ -616,7 +687,7 @@ Example for training setup:
 """
 
         else:
-            return base_prompt
+            return _BASE_SYSTEM_PROMPT
 
     async def parse_intent(
         self,
@@ -637,103 +708,79 @@ Example for training setup:
         Returns:
             GeminiActionResponse: Structured action response
         """
+        cache_key = None
+        if settings.LLM_RESPONSE_CACHE_TTL > 0:
+            cache_key = self._intent_cache_key(state, user_message, temp_data)
+        if cache_key:
+            cached = await response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Intent cache hit (state=%s, user msg=%r)", state, user_message)
+                return GeminiActionResponse.model_validate(cached)
+
         try:
             # Build system prompt based on state
             system_prompt = self._build_system_prompt(state)
 
-            # Build full prompt
-            prompt_parts = [system_prompt]
-
-            # Add context if available
-            if context:
-                prompt_parts.append(f"\n\n=== CONVERSATION HISTORY ===\n{context}\n")
+            # Build full prompt. Keep the order static -> slow-changing -> per-turn
+            # (system prompt, history, config, user message): providers cache
+            # identical prompt prefixes, so anything dynamic placed earlier
+            # would make the rest of the prompt uncacheable.
+            history = _HISTORY_SECTION.format(context=context) if context else ""
 
-            # Add current config if available
+            config = ""
             if temp_data and "config" in temp_data:
-                # TRACE: Step 2 - Before calling Gemini
-                print(f"\n[TRACE-2-LLM-IN] Passing config to Gemini:")
-                print(f"  config: {json.dumps(temp_data['config'], ensure_ascii=False)}")
-
-                config_str = json.dumps(temp_data["config"], ensure_ascii=False, indent=2)
-                prompt_parts.append(f"\n\n=== CURRENT CONFIG (YOU MUST INCLUDE ALL OF THESE IN YOUR RESPONSE!) ===\n{config_str}\n")
-
-                # Extra emphasis
-                config_fields = list(temp_data["config"].keys())
-                prompt_parts.append(f"\n🚨 MANDATORY: Your response MUST include these {len(config_fields)} fields: {', '.join(config_fields)}\n")
-            else:
-                print(f"\n[TRACE-2-LLM-IN] NO CONFIG to pass to Gemini (temp_data has no 'config' key)")
-
-            # Add user message
-            prompt_parts.append(f"\n\n=== USER MESSAGE ===\n{user_message}\n")
-
-            prompt_parts.append("\n\n**IMPORTANT**: Respond ONLY with valid JSON. No markdown, no code blocks, no explanations. Just the JSON object.")
-
-            # Build system prompt and user content
-            system_prompt = self._build_system_prompt(state)
-            user_content = "\n".join(prompt_parts[1:])  # Everything except system prompt
-
-            logger.debug(f"LLM prompt (state={state}):\n{user_content[:500]}...")
+                config = _CONFIG_SECTION.format(
+                    config=orjson.dumps(temp_data["config"], option=orjson.OPT_INDENT_2).decode(),
+                    count=len(temp_data["config"]),
+                    fields=", ".join(temp_data["config"]),
+                )
+
+            # Gemini runs in JSON mode; other providers need the instruction
+            user_content = _USER_PROMPT_TEMPLATE.format(
+                history=history,
+                config=config,
+                user_message=user_message,
+                json_instruction="" if self.provider == "gemini" else _JSON_INSTRUCTION,
+            )
 
-            # Call LLM based on provider
-            if self.provider == "gemini":
-                response_text = await self._call_gemini(system_prompt, user_content)
-            else:
-                response_text = await self._call_openai(system_prompt, user_content)
+            logger.debug("LLM prompt (state=%s):\n%.500s...", state, user_content)
 
-            logger.debug(f"LLM response: {response_text}")
+            response_text = await self._call_llm(system_prompt, user_content)
 
-            # DEBUG: Write raw LLM response to file
-            try:
-                with open("llm_responses.txt", "a", encoding="utf-8") as f:
-                    f.write("\n" + "="*80 + "\n")
-                    f.write(f"State: {state}, User msg: {user_message}\n")
-                    f.write(f"LLM Response:\n{response_text}\n")
-                    f.write("="*80 + "\n")
-            except Exception:
-                pass  # Silently ignore logging errors
+            logger.debug("LLM response (state=%s, user msg=%r):\n%s", state, user_message, response_text)
 
             # Remove markdown code blocks if present
-            if response_text.startswith("```"):
-                # Extract JSON from code block
-                lines = response_text.split("\n")
-                # Skip first line (```json or ```)
-                # Take until the closing ```
-                json_lines = []
-                in_code_block = False
-                for line in lines:
-                    if line.strip().startswith("```"):
-                        if in_code_block:
-                            break  # End of code block
-                        else:
-                            in_code_block = True  # Start of code block
-                            continue
-                    if in_code_block:
-                        json_lines.append(line)
-                response_text = "\n".join(json_lines).strip()
-
-            # Parse JSON
-            response_data = json.loads(response_text)
-
-            # Validate with Pydantic
-            action_response = GeminiActionResponse(**response_data)
-
-            # TRACE: Step 3 - After Gemini responds
-            print(f"\n[TRACE-3-LLM-OUT] Gemini response:")
-            print(f"  action: {action_response.action}")
-            if action_response.current_config:
-                print(f"  current_config: {json.dumps(action_response.current_config, ensure_ascii=False)}")
-                print(f"  current_config keys: {list(action_response.current_config.keys())}")
-            else:
-                print(f"  current_config: NULL/NONE")
-            if action_response.config:
-                print(f"  config: {json.dumps(action_response.config, ensure_ascii=False)}")
-
-            logger.info(f"Parsed action: {action_response.action}")
+            response_text = strip_code_fence(response_text)
+
+            # Parse and validate in one pass (pydantic-core reads the JSON directly)
+            action_response = GeminiActionResponse.model_validate_json(response_text)
+
+            # The default model is the small/fast tier; if it could not make
+            # sense of a detailed message, ask the heavy model once
+            if self._should_retry_heavy(action_response, user_message):
+                logger.info("Ambiguous parse, retrying with heavy model %s", self.heavy_model_name)
+                response_text = strip_code_fence(
+                    await self._call_llm(system_prompt, user_content, heavy=True)
+                )
+                action_response = GeminiActionResponse.model_validate_json(response_text)
+
+            logger.debug(
+                "LLM action=%s current_config=%s config=%s",
+                action_response.action, action_response.current_config, action_response.config
+            )
+            logger.info("Parsed action: %s", action_response.action)
+
+            if cache_key and action_response.action != ActionType.ERROR:
+                await response_cache.set(
+                    cache_key,
+                    action_response.model_dump(mode="json", exclude_none=True),
+                    settings.LLM_RESPONSE_CACHE_TTL,
+                )
 
             return action_response
 
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}\nResponse: {response_text}")
+        except ValidationError as e:  # malformed JSON or a reply that does not fit the schema
+            logger.error(f"LLM response validation error: {e}\nResponse: {response_text}")
             return GeminiActionResponse(
                 action=ActionType.ERROR,
                 message="죄송합니다. 응답 처리 중 오류가 발생했습니다.",
@@ -749,5 +796,11 @@ Example for training setup:
             )
 
 
-# Global instance
-structured_intent_parser = StructuredIntentParser()
+@lru_cache(maxsize=1)
+def get_structured_intent_parser() -> StructuredIntentParser:
+    """Return the shared StructuredIntentParser, created on first use.
+
+    Construction configures the LLM client, so it is deferred until the
+    first chat message instead of running at import time.
+    """
+    return StructuredIntentParser()
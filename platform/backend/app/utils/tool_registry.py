@@ -13,11 +13,38 @@ Phase 1 Implementation:
 
 from typing import Callable, Dict, Any, Optional
 from enum import Enum
+import asyncio
 import logging
+import os
 from sqlalchemy.orm import Session
 
+from app.services.response_cache import ResponseCache
+
 logger = logging.getLogger(__name__)
 
+# analyze_dataset walks the whole dataset tree; the LLM flow often re-issues it
+# for the same path within a conversation, so results are kept briefly in-process
+DATASET_ANALYSIS_CACHE_TTL = 60
+_dataset_analysis_cache = ResponseCache(local_maxsize=32)
+
+
+def _scan_dataset_dirs(base_path: str, category: str, name_suffix: str = "") -> list[dict]:
+    """List dataset directories directly under base_path (blocking, run in a thread)."""
+    if not os.path.isdir(base_path):
+        return []
+
+    datasets = []
+    with os.scandir(base_path) as it:
+        for entry in it:
+            if entry.is_dir():
+                datasets.append({
+                    "name": f"{entry.name}{name_suffix}",
+                    "path": os.path.abspath(entry.path),
+                    "category": category,
+                    "exists": True
+                })
+    return datasets
+
 
 class ToolCategory(str, Enum):
     """Tool categories for organization"""
@@ -283,8 +310,12 @@ class ToolRegistry:
         if not Path(dataset_path).exists():
             raise ValueError(f"Dataset path does not exist: {dataset_path}")
 
-        # Call existing dataset analyzer
-        analysis = analyze_dataset(dataset_path)
+        # Call existing dataset analyzer (filesystem walk, keep it off the event loop)
+        analysis = await _dataset_analysis_cache.get_or_set(
+            f"mvp:datasets:analysis:{os.path.abspath(dataset_path)}",
+            DATASET_ANALYSIS_CACHE_TTL,
+            lambda: asyncio.to_thread(analyze_dataset, dataset_path)
+        )
 
         return {
             "path": dataset_path,
@@ -304,41 +335,19 @@ class ToolRegistry:
         user_id: Optional[int]
     ) -> list[dict]:
         """Handler for list_datasets tool"""
-        from pathlib import Path
-        import os
-
-        datasets = []
-
         # Scan built-in datasets directory (supports Windows/Linux)
         # Default: C:/datasets (Windows dev), /app/datasets (Linux prod)
         datasets_path = os.getenv("DATASETS_PATH", "C:/datasets")
-        builtin_path = Path(datasets_path)
-
-        if builtin_path.exists():
-            for item in builtin_path.iterdir():
-                if item.is_dir():
-                    datasets.append({
-                        "name": f"{item.name} (기본 제공)",
-                        "path": str(item.absolute()),
-                        "category": "built-in",
-                        "exists": True
-                    })
+        scans = [asyncio.to_thread(_scan_dataset_dirs, datasets_path, "built-in", " (기본 제공)")]
 
         # Also scan user-provided base_path if different from default
         base_path = params.get("base_path")
         if base_path and base_path != datasets_path:
-            base_dir = Path(base_path)
-            if base_dir.exists():
-                for item in base_dir.iterdir():
-                    if item.is_dir():
-                        datasets.append({
-                            "name": item.name,
-                            "path": str(item.absolute()),
-                            "category": "user",
-                            "exists": True
-                        })
-
-        return datasets
+            scans.append(asyncio.to_thread(_scan_dataset_dirs, base_path, "user"))
+
+        # Directory scans are blocking I/O: run them off the event loop, concurrently
+        results = await asyncio.gather(*scans)
+        return [dataset for result in results for dataset in result]
 
     async def _search_models(
         self,
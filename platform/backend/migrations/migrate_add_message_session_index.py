@@ -0,0 +1,54 @@
+"""
+Add composite index for loading a session's recent messages
+
+This migration adds:
+- ix_messages_session_id_id: messages of a session ordered by id
+  (conversation context is built from the newest N messages, so the
+  B-tree is scanned backward for ORDER BY id DESC LIMIT N)
+
+Uses IF NOT EXISTS, so the script is safe to re-run on SQLite and PostgreSQL.
+
+Run: python migrations/migrate_add_message_session_index.py
+"""
+
+from app.db.database import engine
+from sqlalchemy import text
+
+INDEXES = [
+    ("ix_messages_session_id_id", "messages", "session_id, id"),
+]
+
+
+def upgrade():
+    """Create message index"""
+    with engine.connect() as conn:
+        for index_name, table, columns in INDEXES:
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {index_name} ON {table}({columns})"
+            ))
+            print(f"[OK] Created/verified index '{index_name}' on {table}({columns})")
+
+        conn.commit()
+        print("[OK] Migration completed successfully!")
+
+
+def downgrade():
+    """Drop message index"""
+    with engine.connect() as conn:
+        for index_name, _, _ in INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+            print(f"[OK] Dropped index '{index_name}'")
+
+        conn.commit()
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Database Migration: Add Message Session Index")
+    print("=" * 60)
+
+    try:
+        upgrade()
+    except Exception as e:
+        print(f"[ERROR] Migration failed: {e}")
+        raise
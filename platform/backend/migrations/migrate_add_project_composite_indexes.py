@@ -0,0 +1,69 @@
+"""
+Add composite indexes for per-user project and per-project experiment listings
+
+This migration adds:
+- ix_projects_user_name: projects filtered by owner and looked up by name
+- ix_training_jobs_project_created: experiments of a project ordered by created_at
+  (the B-tree is scanned backward for ORDER BY created_at DESC)
+
+The leading columns also serve lookups on projects.user_id and
+training_jobs.project_id alone, so the single-column indexes on those
+columns are dropped if an earlier script created them.
+
+All statements use IF [NOT] EXISTS, so the script is safe to re-run on SQLite and PostgreSQL.
+
+Run: python migrations/migrate_add_project_composite_indexes.py
+"""
+
+from app.db.database import engine
+from sqlalchemy import text
+
+INDEXES = [
+    ("ix_projects_user_name", "projects", "user_id, name"),
+    ("ix_training_jobs_project_created", "training_jobs", "project_id, created_at"),
+]
+
+# Single-column indexes made redundant by the composite indexes above
+SUPERSEDED_INDEXES = [
+    "ix_projects_user_id",
+    "ix_training_jobs_project_id",
+]
+
+
+def upgrade():
+    """Create composite indexes"""
+    with engine.connect() as conn:
+        for index_name, table, columns in INDEXES:
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {index_name} ON {table}({columns})"
+            ))
+            print(f"[OK] Created/verified index '{index_name}' on {table}({columns})")
+
+        for index_name in SUPERSEDED_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+            print(f"[OK] Dropped superseded index '{index_name}'")
+
+        conn.commit()
+        print("[OK] Migration completed successfully!")
+
+
+def downgrade():
+    """Drop composite indexes"""
+    with engine.connect() as conn:
+        for index_name, _, _ in INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+            print(f"[OK] Dropped index '{index_name}'")
+
+        conn.commit()
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Database Migration: Add Project Composite Indexes")
+    print("=" * 60)
+
+    try:
+        upgrade()
+    except Exception as e:
+        print(f"[ERROR] Migration failed: {e}")
+        raise
@@ -0,0 +1,59 @@
+"""
+Add trigram index for project name search (PostgreSQL only)
+
+This migration adds:
+- ix_projects_name_trgm: GIN index with gin_trgm_ops on projects.name, so the
+  chat project lookup (name ILIKE '%...%') is served by the index instead
+  of a sequential scan. Requires the pg_trgm extension.
+
+SQLite has no trigram indexes; the script skips it there.
+
+Run: python migrations/migrate_add_project_name_trgm_index.py
+"""
+
+from app.db.database import engine
+from sqlalchemy import text
+
+INDEX_NAME = "ix_projects_name_trgm"
+
+
+def upgrade():
+    """Create trigram index"""
+    if engine.dialect.name != "postgresql":
+        print(f"[SKIP] {engine.dialect.name}: trigram indexes are PostgreSQL only")
+        return
+
+    with engine.connect() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} "
+            f"ON projects USING gin (name gin_trgm_ops)"
+        ))
+        print(f"[OK] Created/verified index '{INDEX_NAME}' on projects(name)")
+
+        conn.commit()
+        print("[OK] Migration completed successfully!")
+
+
+def downgrade():
+    """Drop trigram index (the pg_trgm extension is left installed)"""
+    if engine.dialect.name != "postgresql":
+        return
+
+    with engine.connect() as conn:
+        conn.execute(text(f"DROP INDEX IF EXISTS {INDEX_NAME}"))
+        print(f"[OK] Dropped index '{INDEX_NAME}'")
+
+        conn.commit()
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Database Migration: Add Project Name Trigram Index")
+    print("=" * 60)
+
+    try:
+        upgrade()
+    except Exception as e:
+        print(f"[ERROR] Migration failed: {e}")
+        raise
@@ -0,0 +1,190 @@
+"""Unit tests for ConversationManager.process_message (LLM stubbed).
+
+Tests cover:
+- create_project action end to end (project row + session temp_data persisted)
+- skip_project action on first use (Uncategorized project created)
+- skip_project recreating Uncategorized after it was deleted
+- create_project invalidating cached project lists
+- a new session surviving a DB error on its first message
+- context cache invalidation by updated_at and its size bound
+"""
+
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from typing import Union
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.db.models import Message as MessageModel, Project, Session as SessionModel
+from app.models.conversation import ActionType, ConversationState, GeminiActionResponse
+from app.services.action_handlers import ActionHandlers
+from app.services import conversation_manager
+from app.services.conversation_manager import ConversationManager
+from app.services.response_cache import PROJECTS_LIST_KEY_PREFIX, response_cache
+
+USER_ID = 1
+
+
+class StubIntentParser:
+    """Returns queued responses instead of calling the LLM (queued exceptions are raised)."""
+
+    def __init__(self, *responses: Union[GeminiActionResponse, Exception]):
+        self.responses = list(responses)
+
+    async def parse_intent(self, **kwargs) -> GeminiActionResponse:
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def make_manager(db_session, *responses: Union[GeminiActionResponse, Exception]) -> ConversationManager:
+    with patch(
+        "app.services.conversation_manager.get_structured_intent_parser",
+        return_value=StubIntentParser(*responses),
+    ):
+        return ConversationManager(db_session)
+
+
+@pytest.fixture
+def chat_session(db_session):
+    """A chat session that has already gathered a training config."""
+    session = SessionModel(
+        user_id=USER_ID,
+        state=ConversationState.SELECTING_PROJECT.value,
+        temp_data={"config": {"framework": "timm", "model_name": "resnet50", "task_type": "image_classification"}},
+    )
+    db_session.add(session)
+    db_session.commit()
+    return session
+
+
+class TestProjectActions:
+    """Project actions commit mid-turn; temp_data must still be saved."""
+
+    @pytest.mark.asyncio
+    async def test_create_project(self, db_session, chat_session):
+        """The project is created and the session moves to CONFIRMING with it selected."""
+        manager = make_manager(db_session, GeminiActionResponse(
+            action=ActionType.CREATE_PROJECT,
+            message="프로젝트를 생성합니다",
+            project_name="Cats",
+        ))
+
+        response = await manager.process_message(chat_session.id, "Cats 프로젝트 만들어줘", USER_ID)
+
+        project = db_session.query(Project).filter(Project.name == "Cats").one()
+        assert response["state"] == ConversationState.CONFIRMING.value
+        assert "Cats" in response["message"]
+
+        db_session.expire_all()
+        session = db_session.get(SessionModel, chat_session.id)
+        assert session.state == ConversationState.CONFIRMING.value
+        assert session.temp_data["selected_project_id"] == project.id
+        assert session.temp_data["config"]["model_name"] == "resnet50"
+
+    @pytest.mark.asyncio
+    async def test_create_project_invalidates_project_lists(self, db_session, chat_session):
+        """A project created from chat shows up in the next project list."""
+        await response_cache.set(f"{PROJECTS_LIST_KEY_PREFIX}:{USER_ID}", [], ttl=60)
+        manager = make_manager(db_session, GeminiActionResponse(
+            action=ActionType.CREATE_PROJECT,
+            message="프로젝트를 생성합니다",
+            project_name="Dogs",
+        ))
+
+        await manager.process_message(chat_session.id, "Dogs 프로젝트 만들어줘", USER_ID)
+
+        assert await response_cache.get(f"{PROJECTS_LIST_KEY_PREFIX}:{USER_ID}") is None
+
+    @pytest.mark.asyncio
+    async def test_skip_project_first_use(self, db_session, chat_session):
+        """Skipping creates Uncategorized on first use and selects it."""
+        ActionHandlers._uncategorized_id = None
+        manager = make_manager(db_session, GeminiActionResponse(
+            action=ActionType.SKIP_PROJECT,
+            message="프로젝트 없이 진행합니다",
+        ))
+
+        response = await manager.process_message(chat_session.id, "3", USER_ID)
+
+        project = db_session.query(Project).filter(Project.name == "Uncategorized").one()
+        assert response["state"] == ConversationState.CONFIRMING.value
+
+        db_session.expire_all()
+        session = db_session.get(SessionModel, chat_session.id)
+        assert session.temp_data["selected_project_id"] == project.id
+
+    @pytest.mark.asyncio
+    async def test_skip_project_after_uncategorized_deleted(self, db_session, chat_session):
+        """A stale cached Uncategorized id is not reused once the project is deleted."""
+        stale = Project(name="Uncategorized")
+        db_session.add(stale)
+        db_session.commit()
+        ActionHandlers._uncategorized_id = stale.id
+        db_session.delete(stale)
+        db_session.commit()
+        manager = make_manager(db_session, GeminiActionResponse(
+            action=ActionType.SKIP_PROJECT,
+            message="프로젝트 없이 진행합니다",
+        ))
+
+        await manager.process_message(chat_session.id, "3", USER_ID)
+
+        project = db_session.query(Project).filter(Project.name == "Uncategorized").one()
+        db_session.expire_all()
+        session = db_session.get(SessionModel, chat_session.id)
+        assert session.temp_data["selected_project_id"] == project.id
+
+
+class TestErrorHandling:
+    """Errors roll back the turn but keep the session usable."""
+
+    @pytest.mark.asyncio
+    async def test_new_session_survives_db_error(self, db_session):
+        """The session id returned with the error reply still refers to a saved row."""
+        manager = make_manager(db_session, OperationalError("SELECT 1", {}, Exception("db down")))
+        session = await manager.create_new_session()
+
+        response = await manager.process_message(session.id, "안녕", USER_ID)
+
+        assert response["state"] == ConversationState.ERROR.value
+        db_session.expire_all()
+        assert db_session.get(SessionModel, session.id) is not None
+
+
+class TestContextCache:
+    """Cached context is reused only while the session's updated_at matches."""
+
+    @pytest.mark.asyncio
+    async def test_new_message_invalidates_cached_context(self, db_session, chat_session):
+        """A message written elsewhere (newer updated_at) is picked up on the next turn."""
+        manager = make_manager(db_session, GeminiActionResponse(
+            action=ActionType.ASK_CLARIFICATION,
+            message="어떤 프로젝트를 선택할까요?",
+        ))
+        await manager.process_message(chat_session.id, "첫 메시지", USER_ID)
+        assert chat_session.id in conversation_manager._context_cache
+
+        # Another worker appends a message and bumps updated_at
+        db_session.add(MessageModel(session_id=chat_session.id, role="user", content="다른 워커"))
+        chat_session.updated_at = datetime.utcnow() + timedelta(seconds=1)
+        db_session.commit()
+
+        lines = manager._get_context_lines(chat_session)
+
+        assert lines[-1] == "User: 다른 워커"
+
+    def test_cache_size_bound(self, db_session, monkeypatch):
+        """The least recently used session is evicted past CONTEXT_CACHE_MAXSIZE."""
+        monkeypatch.setattr(conversation_manager, "CONTEXT_CACHE_MAXSIZE", 2)
+        monkeypatch.setattr(conversation_manager, "_context_cache", OrderedDict())
+        manager = make_manager(db_session)
+        now = datetime.utcnow()
+
+        for session_id in (1, 2, 3):
+            manager._remember_context(session_id, now, deque(maxlen=10))
+
+        assert list(conversation_manager._context_cache) == [2, 3]
@@ -0,0 +1,263 @@
+"""Unit tests for StructuredIntentParser helpers (no LLM calls).
+
+Tests cover:
+- Intent cache key scope (cacheable states, project list and selection)
+- Heavy-model retry gate (disabled when LLM_MODEL_HEAVY is unset or empty)
+- read_json_object (strings, escapes, chunk boundaries, truncated streams, closing)
+- strip_code_fence
+- Gemini and OpenAI chunks adapted to text and their streams closed
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.core.config import settings
+from app.models.conversation import ActionType, ConversationState, GeminiActionResponse
+from app.utils.llm_structured import StructuredIntentParser, read_json_object, strip_code_fence
+
+CONFIG = {"framework": "timm", "model_name": "resnet50"}
+PROJECTS = [{"id": 1, "name": "Cats"}, {"id": 2, "name": "Dogs"}]
+
+
+@pytest.fixture
+def parser():
+    """Parser with the provider client left unconfigured."""
+    with patch.object(StructuredIntentParser, "_init_openai"), \
+            patch.object(StructuredIntentParser, "_init_gemini"):
+        return StructuredIntentParser()
+
+
+class TestIntentCacheKey:
+    """Identical inputs may only share a parse when the prompt inputs match."""
+
+    def test_uncacheable_state(self, parser):
+        """States that depend on history are never cached."""
+        assert parser._intent_cache_key(ConversationState.GATHERING_CONFIG, "resnet50", {}) is None
+
+    def test_normalized_message(self, parser):
+        """Case and whitespace differences map to the same key."""
+        temp_data = {"config": CONFIG, "available_projects": PROJECTS}
+        assert (
+            parser._intent_cache_key(ConversationState.SELECTING_PROJECT, " 1번 ", temp_data)
+            == parser._intent_cache_key(ConversationState.SELECTING_PROJECT, "1번", temp_data)
+        )
+
+    def test_project_list_changes_key(self, parser):
+        """"1번" picks a different project once the offered list changes."""
+        before = {"config": CONFIG, "available_projects": PROJECTS}
+        after = {"config": CONFIG, "available_projects": PROJECTS[::-1]}
+        assert (
+            parser._intent_cache_key(ConversationState.SELECTING_PROJECT, "1번", before)
+            != parser._intent_cache_key(ConversationState.SELECTING_PROJECT, "1번", after)
+        )
+
+    def test_selected_project_changes_key(self, parser):
+        """A confirmation is tied to the project it confirms."""
+        first = {"config": CONFIG, "selected_project_id": 1}
+        second = {"config": CONFIG, "selected_project_id": 2}
+        assert (
+            parser._intent_cache_key(ConversationState.CONFIRMING, "네", first)
+            != parser._intent_cache_key(ConversationState.CONFIRMING, "네", second)
+        )
+
+
+class TestHeavyRetry:
+    """Ambiguous parses of detailed messages retry on the heavy model only when one is configured."""
+
+    CLARIFICATION = GeminiActionResponse(action=ActionType.ASK_CLARIFICATION, message="어떤 모델을 쓸까요?")
+    DETAILED_MESSAGE = "resnet50으로 고양이와 개 이미지를 분류하는 모델을 50 에포크 동안 학습하고 싶어요"
+
+    def make_parser(self, monkeypatch, heavy_model):
+        monkeypatch.setattr(settings, "LLM_MODEL_HEAVY", heavy_model)
+        with patch.object(StructuredIntentParser, "_init_openai"), \
+                patch.object(StructuredIntentParser, "_init_gemini"):
+            return StructuredIntentParser()
+
+    @pytest.mark.parametrize("heavy_model", [None, ""])
+    def test_disabled_never_retries(self, monkeypatch, heavy_model):
+        parser = self.make_parser(monkeypatch, heavy_model)
+        assert parser.heavy_model_name is None
+        assert not parser._should_retry_heavy(self.CLARIFICATION, self.DETAILED_MESSAGE)
+
+    def test_configured_retries_detailed_clarification(self, monkeypatch):
+        parser = self.make_parser(monkeypatch, "gpt-4o")
+        assert parser._should_retry_heavy(self.CLARIFICATION, self.DETAILED_MESSAGE)
+        assert not parser._should_retry_heavy(self.CLARIFICATION, "모델?")
+
+
+async def stream_of(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+class StreamCloser:
+    """close() callback that records whether it ran."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def __call__(self):
+        self.closed = True
+
+
+async def read(*chunks) -> str:
+    return await read_json_object(stream_of(*chunks), StreamCloser())
+
+
+class TestReadJsonObject:
+    """Reading stops exactly at the brace closing the first top-level object."""
+
+    @pytest.mark.asyncio
+    async def test_single_chunk_with_trailing_text(self):
+        assert await read('{"action": "ok"} trailing') == '{"action": "ok"}'
+
+    @pytest.mark.asyncio
+    async def test_nested_objects(self):
+        assert await read('{"a": {"b": {}}, "c": 1}\n```') == '{"a": {"b": {}}, "c": 1}'
+
+    @pytest.mark.asyncio
+    async def test_braces_inside_strings(self):
+        text = '{"message": "use {x} and }"}'
+        assert await read(text + " extra") == text
+
+    @pytest.mark.asyncio
+    async def test_escaped_quotes(self):
+        text = '{"message": "say \\"}\\" now"}'
+        assert await read(text + "}") == text
+
+    @pytest.mark.asyncio
+    async def test_escaped_backslash_before_quote(self):
+        text = '{"path": "C:\\\\", "n": 1}'
+        assert await read(text + "}") == text
+
+    @pytest.mark.asyncio
+    async def test_split_across_chunks(self):
+        """Strings, escapes and the closing brace may fall on chunk boundaries."""
+        assert await read('{"message": "a\\', '"}', '"}', " tail") == '{"message": "a\\"}"}'
+
+    @pytest.mark.asyncio
+    async def test_empty_chunks_skipped(self):
+        assert await read(None, '{"a": 1', "", "}") == '{"a": 1}'
+
+    @pytest.mark.asyncio
+    async def test_fenced_output(self):
+        """A leading code fence is kept for strip_code_fence; the trailing fence is never read."""
+        assert await read('```json\n{"action": "ok"}', "\n```") == '```json\n{"action": "ok"}'
+
+    @pytest.mark.asyncio
+    async def test_truncated_stream(self):
+        """An object that never closes returns everything read (left for the JSON parser to reject)."""
+        close = StreamCloser()
+        text = '{"action": "ok", "message": "cut'
+
+        assert await read_json_object(stream_of(text), close) == text
+        assert close.closed
+
+    @pytest.mark.asyncio
+    async def test_closes_after_early_stop(self):
+        close = StreamCloser()
+        await read_json_object(stream_of('{"a": 1}', " never read"), close)
+        assert close.closed
+
+    @pytest.mark.asyncio
+    async def test_closes_on_error(self):
+        async def failing():
+            yield '{"a": '
+            raise ConnectionError("stream dropped")
+
+        close = StreamCloser()
+        with pytest.raises(ConnectionError):
+            await read_json_object(failing(), close)
+        assert close.closed
+
+
+class TestStripCodeFence:
+    """Fenced replies are unwrapped; anything else is returned unchanged."""
+
+    def test_json_fence(self):
+        assert strip_code_fence('```json\n{"a": 1}\n```') == '{"a": 1}'
+
+    def test_bare_fence(self):
+        assert strip_code_fence('```\n{"a": 1}\n```') == '{"a": 1}'
+
+    def test_unclosed_fence(self):
+        """Streams cut at the object's end have no closing fence."""
+        assert strip_code_fence('```json\n{"a": 1}') == '{"a": 1}'
+
+    def test_not_fenced(self):
+        assert strip_code_fence('{"a": "```"}') == '{"a": "```"}'
+
+
+class FakeGeminiResponse:
+    """Async-iterable stream of text chunks ("" yields a chunk without parts) that records whether it was closed."""
+
+    def __init__(self, *texts: str):
+        self.texts = texts
+        self.read = 0
+        self.closed = False
+
+    async def __aiter__(self):
+        try:
+            for text in self.texts:
+                self.read += 1
+                yield SimpleNamespace(parts=[text] if text else [], text=text)
+        finally:
+            self.closed = True
+
+
+class TestGeminiStream:
+    """The stream is cut at the end of the JSON object and then closed."""
+
+    @pytest.mark.asyncio
+    async def test_stream_closed_after_object_ends(self, parser):
+        response = FakeGeminiResponse('{"action": ', '"ok"}\n', "```", " never read")
+
+        async def generate_content_async(prompt, stream):
+            return response
+
+        parser.gemini_model = SimpleNamespace(generate_content_async=generate_content_async)
+
+        assert await parser._call_gemini("system", "user") == '{"action": "ok"}'
+        assert response.read == 2
+        assert response.closed
+
+    @pytest.mark.asyncio
+    async def test_chunks_without_parts_skipped(self, parser):
+        """Chunks without parts (e.g. safety metadata) have no text to read."""
+        response = FakeGeminiResponse("", '{"a": 1}')
+
+        async def generate_content_async(prompt, stream):
+            return response
+
+        parser.gemini_model = SimpleNamespace(generate_content_async=generate_content_async)
+
+        assert await parser._call_gemini("system", "user") == '{"a": 1}'
+
+
+class TestOpenAIStream:
+    """Delta content is read until the JSON object closes, then the HTTP stream is released."""
+
+    @pytest.mark.asyncio
+    async def test_stream_closed_after_object_ends(self, parser):
+        closer = StreamCloser()
+
+        async def chunks():
+            yield SimpleNamespace(choices=[])
+            for text in (None, '{"action": ', '"ok"}', "\n```"):
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+        class Stream:
+            response = SimpleNamespace(aclose=closer)
+
+            def __aiter__(self):
+                return chunks()
+
+        async def create(**kwargs):
+            return Stream()
+
+        parser.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+        assert await parser._call_openai("system", "user") == '{"action": "ok"}'
+        assert closer.closed
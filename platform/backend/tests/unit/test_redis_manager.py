@@ -404,6 +404,16 @@ class TestRedisManagerUtilities:
         assert "test:user:1" in user_keys
         assert "test:user:2" in user_keys
 
+    @pytest.mark.asyncio
+    async def test_scan_keys_pattern_matching(self, redis_manager):
+        """Test SCAN-based pattern matching finds the same keys as KEYS."""
+        await redis_manager.set("test:user:1", "alice")
+        await redis_manager.set("test:user:2", "bob")
+        await redis_manager.set("test:session:1", "data")
+
+        user_keys = await redis_manager.scan_keys("test:user:*", count=1)
+        assert sorted(user_keys) == ["test:user:1", "test:user:2"]
+
     @pytest.mark.asyncio
     async def test_flushdb(self, redis_manager):
         """Test flushing database."""
@@ -0,0 +1,85 @@
+"""Unit tests for ResponseCache (in-process fallback path).
+
+Tests cover:
+- get_or_set with sync and async loaders
+- TTL expiry
+- Pattern invalidation
+- Local size bound
+- Project list invalidation
+"""
+
+import pytest
+
+from app.services.response_cache import ResponseCache, invalidate_project_lists, response_cache
+
+
+class TestResponseCacheLocal:
+    """Test ResponseCache without Redis attached."""
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_calls_loader_once(self):
+        """Loader runs on the first call only."""
+        cache = ResponseCache()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return [{"id": 1}]
+
+        assert await cache.get_or_set("mvp:test:a", 60, loader) == [{"id": 1}]
+        assert await cache.get_or_set("mvp:test:a", 60, loader) == [{"id": 1}]
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_async_loader(self):
+        """Async loaders are awaited."""
+        cache = ResponseCache()
+
+        async def loader():
+            return {"ok": True}
+
+        assert await cache.get_or_set("mvp:test:b", 60, loader) == {"ok": True}
+        assert await cache.get("mvp:test:b") == {"ok": True}
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_miss(self):
+        """Entries past their TTL are not returned."""
+        cache = ResponseCache()
+        await cache.set("mvp:test:c", "value", ttl=-1)
+
+        assert await cache.get("mvp:test:c") is None
+
+    @pytest.mark.asyncio
+    async def test_delete_pattern(self):
+        """Only keys matching the pattern are invalidated."""
+        cache = ResponseCache()
+        await cache.set("mvp:admin:projects:all", [], ttl=60)
+        await cache.set("mvp:admin:users:admin", [], ttl=60)
+        await cache.set("mvp:datasets:available:1", [], ttl=60)
+
+        assert await cache.delete_pattern("mvp:admin:*") == 2
+        assert await cache.get("mvp:admin:projects:all") is None
+        assert await cache.get("mvp:datasets:available:1") == []
+
+    @pytest.mark.asyncio
+    async def test_local_size_bound(self):
+        """The local fallback never grows past local_maxsize."""
+        cache = ResponseCache(local_maxsize=2)
+        for i in range(5):
+            await cache.set(f"mvp:test:{i}", i, ttl=60)
+
+        assert len(cache._local) == 2
+        assert await cache.get("mvp:test:4") == 4
+
+    @pytest.mark.asyncio
+    async def test_invalidate_project_lists(self):
+        """All users' project lists are dropped; other entries are kept."""
+        await response_cache.set("mvp:projects:list:1", [], ttl=60)
+        await response_cache.set("mvp:projects:list:2", [], ttl=60)
+        await response_cache.set("mvp:admin:projects:None:100", [], ttl=60)
+
+        await invalidate_project_lists()
+
+        assert await response_cache.get("mvp:projects:list:1") is None
+        assert await response_cache.get("mvp:projects:list:2") is None
+        assert await response_cache.get("mvp:admin:projects:None:100") == []
@@ -49,18 +49,29 @@ export default function AdminProjectsPanel() {
       const token = localStorage.getItem('access_token')
       if (!token) return
 
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/admin/projects`, {
-        headers: {
-          'Authorization': `Bearer ${token}`
+      // Admin lists are keyset-paginated: follow X-Next-Cursor until the last page
+      const allProjects: Project[] = []
+      let cursor: string | null = null
+      do {
+        const query = cursor ? `?cursor=${cursor}` : ''
+        const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/admin/projects${query}`, {
+          headers: {
+            'Authorization': `Bearer ${token}`
+          }
+        })
+
+        if (!response.ok) {
+          if (response.status === 403) {
+            alert('관리자 권한이 필요합니다.')
+          }
+          return
         }
-      })
 
-      if (response.ok) {
-        const data = await response.json()
-        setProjects(data)
-      } else if (response.status === 403) {
-        alert('관리자 권한이 필요합니다.')
-      }
+        allProjects.push(...(await response.json()))
+        cursor = response.headers.get('X-Next-Cursor')
+      } while (cursor)
+
+      setProjects(allProjects)
     } catch (error) {
       console.error('Failed to fetch projects:', error)
     } finally {
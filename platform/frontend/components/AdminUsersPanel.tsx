@@ -58,18 +58,29 @@ export default function AdminUsersPanel() {
       const token = localStorage.getItem('access_token')
       if (!token) return
 
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/admin/users`, {
-        headers: {
-          'Authorization': `Bearer ${token}`
+      // Admin lists are keyset-paginated: follow X-Next-Cursor until the last page
+      const allUsers: User[] = []
+      let cursor: string | null = null
+      do {
+        const query = cursor ? `?cursor=${cursor}` : ''
+        const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/admin/users${query}`, {
+          headers: {
+            'Authorization': `Bearer ${token}`
+          }
+        })
+
+        if (!response.ok) {
+          if (response.status === 403) {
+            alert('관리자 권한이 필요합니다.')
+          }
+          return
         }
-      })
 
-      if (response.ok) {
-        const data = await response.json()
-        setUsers(data)
-      } else if (response.status === 403) {
-        alert('관리자 권한이 필요합니다.')
-      }
+        allUsers.push(...(await response.json()))
+        cursor = response.headers.get('X-Next-Cursor')
+      } while (cursor)
+
+      setUsers(allUsers)
     } catch (error) {
       console.error('Failed to fetch users:', error)
     } finally {